@@ -306,10 +306,7 @@ def main():
         {
             "smooth_trend": smooth_results["equity_curve"],
             "original_trend": original_results["equity_curve"],
-            "buy_hold": [
-                10000 * (df["close"].iloc[i] / df["close"].iloc[0])
-                for i in range(len(df))
-            ],
+            "buy_hold": 10000 * (df["close"].to_numpy() / df["close"].iloc[0]),
         }
     )
     equity_file = outputs_dir / "equity_curves.csv"
@@ -184,12 +184,8 @@ def example_3_compare_strategies():
         },
     }
 
-    results_dict = {}
-    for name, config in configs.items():
-        strategy = TrendFollowingStrategy(config)
-        engine = BacktestEngine({"initial_capital": 10000.0})
-        results = engine.run(df, strategy)
-        results_dict[name] = results
+    engine = BacktestEngine({"initial_capital": 10000.0})
+    results_dict = engine.run_many(df, TrendFollowingStrategy, configs)
 
     # Compare strategies
     print("\nComparison Table:")
@@ -308,16 +304,8 @@ def example_5_full_comparison_report():
         },
     }
 
-    results_dict = {}
-    configs_dict = {}
-
-    for name, config in configs.items():
-        strategy = TrendFollowingStrategy(config)
-        engine = BacktestEngine({"initial_capital": 10000.0})
-        results = engine.run(df, strategy)
-
-        results_dict[name] = results
-        configs_dict[name] = config
+    engine = BacktestEngine({"initial_capital": 10000.0})
+    results_dict = engine.run_many(df, TrendFollowingStrategy, configs)
 
     # Generate full comparison reports
     # Note: comparison reports use a separate directory (not timestamped)
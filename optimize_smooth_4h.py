@@ -3,8 +3,13 @@
 Finds optimal parameters for smooth, consistent returns.
 """
 
+import os
 import sys
 import json
+import hashlib
+import argparse
+import warnings
+from concurrent.futures import ProcessPoolExecutor
 from pathlib import Path
 
 sys.path.insert(0, "/Users/aerox0/dev/trading-tests2")
@@ -17,6 +22,8 @@ from datetime import datetime, timedelta
 from src.data.fetcher import DataFetcher
 from src.strategies.smooth_trend_4h import SmoothTrend4HStrategy
 from src.backtest.engine import BacktestEngine
+from src.core.kernels import equity_stats
+from src.indicators import ATR, RSI, ADX
 
 
 def calculate_smoothness_objective(results):
@@ -28,13 +35,14 @@ def calculate_smoothness_objective(results):
     - Low max drawdown (smoothness)
     - Low standard deviation of returns (equity curve smoothness)
     """
-    equity_curve = np.array(results["equity_curve"])
-    returns = np.diff(equity_curve) / equity_curve[:-1]
+    # Return std in one pass over the equity curve (no returns array)
+    equity_curve = np.asarray(results["equity_curve"], dtype=np.float64)
+    _, return_std, _ = equity_stats(equity_curve)
 
     sharpe = results["sharpe_ratio"]
     win_rate = results["win_rate"]
     max_dd = abs(results["max_drawdown"])
-    return_std = returns.std() * 100 if len(returns) > 0 else 0
+    return_std = return_std * 100
 
     # Weighted objective: prioritize Sharpe and smoothness
     # Sharpe: 40% weight
@@ -57,84 +65,413 @@ def calculate_smoothness_objective(results):
     return objective
 
 
-def optimize_smooth_trend(df, n_trials=200):
-    """Optimize smooth trend strategy using Bayesian optimization"""
+# Hyperband resource: backtest length in 30-day chunks of 4h bars, from six
+# months up to the full two years of data
+CHUNK_BARS = 180
+MIN_CHUNKS = 6
+MAX_CHUNKS = 24
+REDUCTION_FACTOR = 3
 
-    def objective(trial):
-        # Suggest parameters
-        ema_fast = trial.suggest_int("ema_fast", 30, 80)
-        ema_slow = trial.suggest_int("ema_slow", ema_fast + 20, 200)
+# Hyperband rungs (MIN_CHUNKS * REDUCTION_FACTOR**k below MAX_CHUNKS); trials
+# report their objective on these prefixes before the full backtest
+PRUNING_CHUNKS = (6, 18)
 
-        atr_sl = trial.suggest_float("atr_multiplier_sl", 0.3, 0.8)
-        atr_tp = trial.suggest_float("atr_multiplier_tp", atr_sl * 2, 3.5)
+# TPE seed for this process; parallel workers use SAMPLER_SEED + worker index
+SAMPLER_SEED = 42
 
-        trail_mult = trial.suggest_float("trail_multiplier", 0.3, 0.8)
 
-        rsi_period = trial.suggest_int("rsi_period", 7, 14)
+# Candidate RSI periods (inclusive); few enough to precompute each one
+RSI_PERIODS = (7, 14)
 
-        # RSI filters - wider ranges
-        rsi_long_min = trial.suggest_int("rsi_long_min", 25, 40)
-        rsi_long_max = trial.suggest_int("rsi_long_max", rsi_long_min + 15, 70)
 
-        rsi_short_min = trial.suggest_int("rsi_short_min", 30, 45)
-        rsi_short_max = trial.suggest_int("rsi_short_max", rsi_short_min + 15, 75)
+def precompute_indicators(df):
+    """Compute the indicators that do not vary between trials
 
-        adx_threshold = trial.suggest_int("adx_threshold", 15, 30)
+    ATR, ADX and the volume average use fixed periods in every trial and RSI
+    has only a few candidate periods, so they are computed once up front
+    instead of in each trial.
 
-        volume_multiplier = trial.suggest_float("volume_multiplier", 0.9, 1.5)
+    Returns:
+        Dictionary with "atr", "adx" and "volume_avg" Series and "rsi", a
+        dictionary of RSI Series keyed by period
+    """
+    rsi = RSI()
+    return {
+        "atr": ATR().calculate(df, 14),
+        "adx": ADX().calculate(df, 14),
+        "volume_avg": df["volume"].rolling(window=20).mean(),
+        "rsi": {
+            period: rsi.calculate(df, period)
+            for period in range(RSI_PERIODS[0], RSI_PERIODS[1] + 1)
+        },
+    }
+
+
+def suggest_config(trial):
+    """Sample a strategy config from the search space
+
+    Args:
+        trial: Optuna trial
+
+    Returns:
+        Strategy config dictionary
+    """
+    # Suggest parameters
+    ema_fast = trial.suggest_int("ema_fast", 30, 80)
+    ema_slow = trial.suggest_int("ema_slow", ema_fast + 20, 200)
+
+    atr_sl = trial.suggest_float("atr_multiplier_sl", 0.3, 0.8)
+    atr_tp = trial.suggest_float("atr_multiplier_tp", atr_sl * 2, 3.5)
+
+    trail_mult = trial.suggest_float("trail_multiplier", 0.3, 0.8)
+
+    rsi_period = trial.suggest_int("rsi_period", *RSI_PERIODS)
+
+    # RSI filters - wider ranges
+    rsi_long_min = trial.suggest_int("rsi_long_min", 25, 40)
+    rsi_long_max = trial.suggest_int("rsi_long_max", rsi_long_min + 15, 70)
+
+    rsi_short_min = trial.suggest_int("rsi_short_min", 30, 45)
+    rsi_short_max = trial.suggest_int("rsi_short_max", rsi_short_min + 15, 75)
+
+    adx_threshold = trial.suggest_int("adx_threshold", 15, 30)
+
+    volume_multiplier = trial.suggest_float("volume_multiplier", 0.9, 1.5)
+
+    pullback_threshold = trial.suggest_float("pullback_threshold_pct", 0.008, 0.02)
+
+    time_stop = trial.suggest_int("time_stop_bars", 5, 15)
+
+    position_size = trial.suggest_float("position_size_pct", 0.4, 0.7)
+
+    # Strategy config
+    config = {
+        "ema_fast": ema_fast,
+        "ema_slow": ema_slow,
+        "atr_period": 14,
+        "atr_multiplier_sl": atr_sl,
+        "atr_multiplier_tp": atr_tp,
+        "trail_multiplier": trail_mult,
+        "rsi_period": rsi_period,
+        "rsi_long_min": rsi_long_min,
+        "rsi_long_max": rsi_long_max,
+        "rsi_short_min": rsi_short_min,
+        "rsi_short_max": rsi_short_max,
+        "adx_period": 14,
+        "adx_threshold": adx_threshold,
+        "volume_period": 20,
+        "volume_multiplier": volume_multiplier,
+        "pullback_threshold_pct": pullback_threshold,
+        "time_stop_bars": time_stop,
+        "position_size_pct": position_size,
+        "initial_capital": 10000.0,
+    }
+
+    return config
+
+
+def _make_strategy(config, indicators):
+    """Strategy using the precomputed indicators for the config's RSI period"""
+    return SmoothTrend4HStrategy(
+        config,
+        indicators={**indicators, "rsi": indicators["rsi"][config["rsi_period"]]},
+    )
+
+
+def evaluate_config(config, df, indicators, end=None):
+    """Smoothness objective of one backtest, without pruning
 
-        pullback_threshold = trial.suggest_float("pullback_threshold_pct", 0.008, 0.02)
+    Args:
+        config: Strategy config
+        df: OHLCV data
+        indicators: Output of ``precompute_indicators(df)``
+        end: Backtest only the first ``end`` bars (default: all of ``df``)
 
-        time_stop = trial.suggest_int("time_stop_bars", 5, 15)
+    Returns:
+        Objective value (-1.0 for invalid configurations)
+    """
+    try:
+        engine = BacktestEngine({"initial_capital": 10000.0})
+        results = engine.run(
+            df.iloc[:end], _make_strategy(config, indicators), validate=False
+        )
+        return calculate_smoothness_objective(results)
+
+    except ValueError:
+        # Penalize invalid configurations (rejected by the strategy)
+        return -1.0
+
+
+def _pruning_steps(n_bars):
+    """(chunks, end bar) of each pruning prefix shorter than the data"""
+    return [
+        (chunks, chunks * CHUNK_BARS)
+        for chunks in PRUNING_CHUNKS
+        if chunks * CHUNK_BARS < n_bars
+    ]
 
-        position_size = trial.suggest_float("position_size_pct", 0.4, 0.7)
 
-        # Strategy config
-        config = {
-            "ema_fast": ema_fast,
-            "ema_slow": ema_slow,
-            "atr_period": 14,
-            "atr_multiplier_sl": atr_sl,
-            "atr_multiplier_tp": atr_tp,
-            "trail_multiplier": trail_mult,
-            "rsi_period": rsi_period,
-            "rsi_long_min": rsi_long_min,
-            "rsi_long_max": rsi_long_max,
-            "rsi_short_min": rsi_short_min,
-            "rsi_short_max": rsi_short_max,
-            "adx_period": 14,
-            "adx_threshold": adx_threshold,
-            "volume_period": 20,
-            "volume_multiplier": volume_multiplier,
-            "pullback_threshold_pct": pullback_threshold,
-            "time_stop_bars": time_stop,
-            "position_size_pct": position_size,
-            "initial_capital": 10000.0,
-        }
+def _report(trial, chunks, value, best_intermediate):
+    """Report a prefix objective to the pruner
+
+    Returns:
+        Tuple of (best intermediate objective so far, whether to prune)
+    """
+    trial.report(value, chunks)
+    if best_intermediate is None or value > best_intermediate:
+        best_intermediate = value
+
+    prune = trial.should_prune()
+    if prune:
+        # Keep the best partial score of near-miss trials for analysis
+        trial.set_user_attr("best_intermediate", best_intermediate)
+    return best_intermediate, prune
 
-        try:
-            # Run backtest
-            strategy = SmoothTrend4HStrategy(config)
-            engine = BacktestEngine({"initial_capital": 10000.0})
-            results = engine.run(df, strategy)
 
-            # Calculate objective
-            objective_value = calculate_smoothness_objective(results)
+def objective(trial, df, indicators):
+    """Smoothness objective for one trial, evaluated on ``df``
 
-            return objective_value
+    Defined at module level so worker processes can run it.
 
-        except Exception as e:
-            # Penalize invalid configurations
-            return -1.0
+    Args:
+        trial: Optuna trial
+        df: OHLCV data
+        indicators: Output of ``precompute_indicators(df)``
+    """
+    config = suggest_config(trial)
+
+    # Backtest on growing chronological prefixes so Hyperband can stop
+    # trials that already underperform on the shorter backtests
+    best_intermediate = None
+    for chunks, end in _pruning_steps(len(df)):
+        value = evaluate_config(config, df, indicators, end)
+        best_intermediate, prune = _report(trial, chunks, value, best_intermediate)
+        if prune:
+            raise optuna.TrialPruned()
+
+    return evaluate_config(config, df, indicators)
+
+
+def _make_pruner():
+    """Hyperband pruning over backtest length"""
+    return optuna.pruners.HyperbandPruner(
+        min_resource=MIN_CHUNKS,
+        max_resource=MAX_CHUNKS,
+        reduction_factor=REDUCTION_FACTOR,
+    )
 
+
+def _make_sampler(seed):
+    """Multivariate TPE sampler
+
+    Models correlated parameters (EMA and RSI bounds) jointly, and the
+    constant liar keeps parallel workers from suggesting the same points
+    while their trials are still running.
+    """
+    with warnings.catch_warnings():
+        # These TPE options are flagged experimental by Optuna
+        warnings.simplefilter("ignore", optuna.exceptions.ExperimentalWarning)
+        return optuna.samplers.TPESampler(
+            multivariate=True,
+            group=True,
+            constant_liar=True,
+            n_startup_trials=20,
+            seed=seed,
+        )
+
+
+def _make_storage(storage):
+    """Optuna storage for a URL
+
+    SQLite gets a long lock timeout so concurrent workers wait for each
+    other's writes instead of failing, and its directory is created if needed.
+    """
+    if storage is None or not storage.startswith("sqlite"):
+        return storage
+    database = storage.split("///", 1)[-1]
+    if database and database != ":memory:":
+        Path(database).parent.mkdir(parents=True, exist_ok=True)
+    return optuna.storages.RDBStorage(
+        storage, engine_kwargs={"connect_args": {"timeout": 300}}
+    )
+
+
+def _data_fingerprint(df):
+    """Short hash of the OHLCV data (values and timestamps)
+
+    Part of the study name, so a stored study is only resumed on the same
+    data it was scored on.
+    """
+    hashes = pd.util.hash_pandas_object(df, index=True).to_numpy()
+    return hashlib.sha1(hashes.tobytes()).hexdigest()[:12]
+
+
+def _run_trials(study_name, storage, df, indicators, n_trials, seed):
+    """Worker process: run trials against the shared study storage"""
+    optuna.logging.set_verbosity(optuna.logging.WARNING)
+    study = optuna.load_study(
+        study_name=study_name,
+        storage=_make_storage(storage),
+        sampler=_make_sampler(seed),
+        pruner=_make_pruner(),
+    )
+    study.optimize(lambda trial: objective(trial, df, indicators), n_trials=n_trials)
+
+
+# Per-process data for batched trial evaluation, set once by _init_worker
+_worker_df = None
+_worker_indicators = None
+
+
+def _init_worker(df, indicators):
+    """Store the data and precomputed indicators in a worker process"""
+    global _worker_df, _worker_indicators
+    _worker_df = df
+    _worker_indicators = indicators
+
+
+def _evaluate_in_worker(config, end=None):
+    """Evaluate one config on (a prefix of) the worker's data"""
+    return evaluate_config(config, _worker_df, _worker_indicators, end)
+
+
+def _run_batch(study, executor, n_trials, n_bars):
+    """Ask for a batch of trials, backtest them in workers and tell the results
+
+    Prefix backtests run for the whole batch one pruning step at a time, so
+    Hyperband can stop trials between steps as in the sequential path.
+    """
+    trials = [study.ask() for _ in range(n_trials)]
+    configs = [suggest_config(trial) for trial in trials]
+    best = [None] * n_trials
+
+    active = list(range(n_trials))
+    for chunks, end in _pruning_steps(n_bars):
+        values = executor.map(
+            _evaluate_in_worker, [configs[i] for i in active], [end] * len(active)
+        )
+        survivors = []
+        for i, value in zip(active, values):
+            best[i], prune = _report(trials[i], chunks, value, best[i])
+            if prune:
+                study.tell(trials[i], state=optuna.trial.TrialState.PRUNED)
+            else:
+                survivors.append(i)
+        active = survivors
+
+    values = executor.map(_evaluate_in_worker, [configs[i] for i in active])
+    for i, value in zip(active, values):
+        study.tell(trials[i], value)
+
+
+def optimize_smooth_trend(
+    df,
+    n_trials=200,
+    n_jobs=None,
+    storage=None,
+    study_name="smooth_4h",
+):
+    """Optimize smooth trend strategy using Bayesian optimization
+
+    Trials are independent CPU-bound backtests, so they are split across
+    worker processes. By default the study is kept in memory: batches of
+    trials are sampled in this process and backtested in worker processes
+    (ask/tell), with the same Hyperband pruning as a sequential run. With an
+    RDB ``storage`` the workers share the study through the database instead,
+    and re-running with the same storage, study name and data resumes the
+    study. Storage I/O costs more than a backtest, so only use it when the
+    study must persist.
+
+    Args:
+        df: OHLCV data
+        n_trials: Number of finished trials the study should have; a
+            resumed study only runs the missing ones
+        n_jobs: Number of worker processes (default: one per CPU core)
+        storage: Optuna storage URL, e.g. "sqlite:///outputs/smooth_study.db"
+            (default: keep the study in memory)
+        study_name: Study name prefix within the storage; a hash of ``df``
+            is appended, so only a study on identical data is resumed
+
+    Returns:
+        Dictionary with best parameters, final backtest results and study
+    """
     print(f"\nRunning Bayesian optimization ({n_trials} trials)...")
     print("This may take a few minutes...")
 
-    # Create study
-    study = optuna.create_study(direction="maximize")
+    # Data is the same for every trial, so validate it once
+    BacktestEngine({"initial_capital": 10000.0}).validate_data(df)
+    indicators = precompute_indicators(df)
+
+    # Trials stored for other data (e.g. an older fetch window) are not comparable
+    study_name = f"{study_name}-{_data_fingerprint(df)}"
+
+    # Per-trial log lines duplicate the progress bar; only show warnings
+    # while the study runs, then restore the caller's verbosity
+    verbosity = optuna.logging.get_verbosity()
+    optuna.logging.set_verbosity(optuna.logging.WARNING)
+    try:
+        study = optuna.create_study(
+            direction="maximize",
+            sampler=_make_sampler(SAMPLER_SEED),
+            pruner=_make_pruner(),
+            storage=_make_storage(storage),
+            study_name=study_name,
+            load_if_exists=True,
+        )
 
-    # Optimize with progress bar
-    study.optimize(objective, n_trials=n_trials, show_progress_bar=True)
+        # A resumed study only runs the trials it is still missing
+        finished = study.get_trials(
+            deepcopy=False,
+            states=(optuna.trial.TrialState.COMPLETE, optuna.trial.TrialState.PRUNED),
+        )
+        if finished:
+            print(f"Resuming study '{study_name}' with {len(finished)} finished trials")
+        remaining = max(n_trials - len(finished), 0)
+
+        if n_jobs is None:
+            n_jobs = os.cpu_count() or 1
+        n_jobs = min(n_jobs, remaining)
+
+        if n_jobs > 1 and storage is not None:
+            # Split trials evenly; each worker loads the study from storage
+            shares = [
+                remaining // n_jobs + (i < remaining % n_jobs) for i in range(n_jobs)
+            ]
+            with ProcessPoolExecutor(max_workers=n_jobs) as executor:
+                futures = [
+                    # Distinct seeds so workers' startup samples differ
+                    executor.submit(
+                        _run_trials,
+                        study_name,
+                        storage,
+                        df,
+                        indicators,
+                        share,
+                        SAMPLER_SEED + i + 1,
+                    )
+                    for i, share in enumerate(shares)
+                ]
+                for future in futures:
+                    future.result()
+        elif n_jobs > 1:
+            # In-memory study: sample a batch of configs here, backtest them in
+            # worker processes and tell the results back
+            with ProcessPoolExecutor(
+                max_workers=n_jobs,
+                initializer=_init_worker,
+                initargs=(df, indicators),
+            ) as executor:
+                for start in range(0, remaining, n_jobs):
+                    _run_batch(study, executor, min(n_jobs, remaining - start), len(df))
+        else:
+            # Optimize with progress bar
+            study.optimize(
+                lambda trial: objective(trial, df, indicators),
+                n_trials=remaining,
+                show_progress_bar=True,
+            )
+    finally:
+        optuna.logging.set_verbosity(verbosity)
 
     print(f"\nOptimization complete!")
     print(f"Best objective value: {study.best_value:.4f}")
@@ -166,6 +503,28 @@ def optimize_smooth_trend(df, n_trials=200):
 
 
 def main():
+    parser = argparse.ArgumentParser(
+        description="Optimize the Smooth Trend 4H strategy with Optuna",
+        formatter_class=argparse.RawDescriptionHelpFormatter,
+        epilog="""
+Examples:
+  uv run optimize_smooth_4h.py
+  uv run optimize_smooth_4h.py --storage sqlite:///outputs/smooth_study.db
+        """,
+    )
+    parser.add_argument(
+        "--storage",
+        default=None,
+        help="Optuna storage URL to persist and resume the study "
+        "(default: in memory)",
+    )
+    parser.add_argument(
+        "--study-name",
+        default="smooth_4h",
+        help="Study name prefix in the storage (default: smooth_4h)",
+    )
+    args = parser.parse_args()
+
     print("=" * 80)
     print("SMOOTH TREND 4H - BAYESIAN OPTIMIZATION")
     print("=" * 80)
@@ -186,16 +545,19 @@ def main():
 
     print(f"Data: {len(df)} candles from {df.index[0]} to {df.index[-1]}")
 
+    # Results are saved to outputs/
+    outputs_dir = Path("outputs")
+    outputs_dir.mkdir(exist_ok=True)
+
     # Run optimization
     print("\n[2/3] Running Bayesian optimization...")
-    optimization_results = optimize_smooth_trend(df, n_trials=200)
+    optimization_results = optimize_smooth_trend(
+        df, n_trials=200, storage=args.storage, study_name=args.study_name
+    )
 
     # Save results
     print("\n[3/3] Saving results...")
 
-    outputs_dir = Path("outputs")
-    outputs_dir.mkdir(exist_ok=True)
-
     # Save optimization results
     results_file = outputs_dir / "smooth_trend_4h_optimization.json"
     with open(results_file, "w") as f:
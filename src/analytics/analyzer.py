@@ -12,6 +12,7 @@ from .metrics import (
     calculate_profit_distribution,
     calculate_annualized_metrics,
     calculate_drawdown_series,
+    trade_pnls,
 )
 
 
@@ -156,10 +157,6 @@ class ResultsAnalyzer:
                 "loss_streak_max": 0,
             }
 
-        pnls = [t["pnl"] for t in self.trades]
-        wins = [p for p in pnls if p > 0]
-        losses = [p for p in pnls if p < 0]
-
         stats = {}
 
         # Streaks
@@ -214,22 +211,22 @@ class ResultsAnalyzer:
         if not self.trades:
             return {}
 
-        pnls = [t["pnl"] for t in self.trades]
-        wins = [p for p in pnls if p > 0]
-        losses = [p for p in pnls if p < 0]
+        pnls = trade_pnls(self.trades)
+        wins = pnls[pnls > 0]
+        losses = pnls[pnls < 0]
 
         dist = {}
 
         # Win/Loss ratio
-        if losses:
-            dist["win_loss_ratio"] = sum(wins) / abs(sum(losses))
+        if losses.size:
+            dist["win_loss_ratio"] = wins.sum() / abs(losses.sum())
         else:
-            dist["win_loss_ratio"] = np.inf if wins else 0
+            dist["win_loss_ratio"] = np.inf if wins.size else 0
 
         # Median trade
         dist["median_trade_pnl"] = np.median(pnls)
-        dist["median_win"] = np.median(wins) if wins else 0
-        dist["median_loss"] = np.median(losses) if losses else 0
+        dist["median_win"] = np.median(wins) if wins.size else 0
+        dist["median_loss"] = np.median(losses) if losses.size else 0
 
         return dist
 
@@ -197,6 +197,18 @@ def calculate_monthly_returns(
     return monthly_returns_df
 
 
+def trade_pnls(trades: List[Dict]) -> np.ndarray:
+    """Collect trade PnLs into a single float64 array
+
+    Args:
+        trades: List of trade dictionaries
+
+    Returns:
+        Array of trade PnLs in trade order
+    """
+    return np.fromiter((t["pnl"] for t in trades), dtype=np.float64, count=len(trades))
+
+
 def calculate_profit_distribution(trades: List[Dict]) -> Dict[str, float]:
     """Calculate profit distribution statistics
 
@@ -216,24 +228,24 @@ def calculate_profit_distribution(trades: List[Dict]) -> Dict[str, float]:
             "expected_value": 0,
         }
 
-    pnls = [t["pnl"] for t in trades]
-    wins = [p for p in pnls if p > 0]
-    losses = [p for p in pnls if p < 0]
+    pnls = trade_pnls(trades)
+    wins = pnls[pnls > 0]
+    losses = pnls[pnls < 0]
 
-    avg_win = np.mean(wins) if wins else 0
-    avg_loss = np.mean(losses) if losses else 0
-    largest_win = max(wins) if wins else 0
-    largest_loss = min(losses) if losses else 0
+    avg_win = wins.mean() if wins.size else 0
+    avg_loss = losses.mean() if losses.size else 0
+    largest_win = wins.max() if wins.size else 0
+    largest_loss = losses.min() if losses.size else 0
 
-    total_wins = sum(wins)
-    total_losses = sum(losses)
+    total_wins = wins.sum()
+    total_losses = losses.sum()
 
     if total_losses != 0:
         profit_factor = abs(total_wins / total_losses)
     else:
-        profit_factor = float("inf") if wins else 0
+        profit_factor = float("inf") if wins.size else 0
 
-    expected_value = np.mean(pnls)
+    expected_value = pnls.mean()
 
     return {
         "avg_win": avg_win,
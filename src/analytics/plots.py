@@ -66,10 +66,7 @@ def plot_equity_curve(
             and len(df) == len(equity_curve)
         ):
             # Calculate buy & hold equity curve
-            bah_equity = [
-                initial_capital_bah * (price / start_price)
-                for price in df["close"].values
-            ]
+            bah_equity = initial_capital_bah * (df["close"].to_numpy() / start_price)
             fig.add_trace(
                 go.Scatter(
                     x=x_axis,
@@ -232,13 +229,9 @@ def plot_drawdown(
 
         if start_price and end_price and len(df) == len(equity_curve):
             # Calculate buy & hold equity curve
-            bah_equity = [
-                initial_capital_bah * (price / start_price)
-                for price in df["close"].values
-            ]
-            bah_equity_array = np.array(bah_equity)
-            bah_running_max = np.maximum.accumulate(bah_equity_array)
-            bah_drawdown = (bah_equity_array - bah_running_max) / bah_running_max * 100
+            bah_equity = initial_capital_bah * (df["close"].to_numpy() / start_price)
+            bah_running_max = np.maximum.accumulate(bah_equity)
+            bah_drawdown = (bah_equity - bah_running_max) / bah_running_max * 100
 
             fig.add_trace(
                 go.Scatter(
@@ -387,10 +380,7 @@ def plot_monthly_returns(
 
             if start_price and end_price and len(df) == len(timestamps):
                 # Calculate buy & hold equity curve
-                bah_equity = [
-                    initial_capital_bh * (price / start_price)
-                    for price in df["close"].values
-                ]
+                bah_equity = initial_capital_bh * (df["close"].to_numpy() / start_price)
                 df_bh = pd.DataFrame({"equity": bah_equity}, index=timestamps)
                 monthly_bh = df_bh.resample("ME").last().dropna()
                 monthly_bh_returns = monthly_bh.pct_change().dropna() * 100
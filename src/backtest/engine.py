@@ -2,8 +2,47 @@
 
 from ..core.base_backtest import BaseBacktest
 from ..core.base_strategy import BaseStrategy
+import os
+from concurrent.futures import ProcessPoolExecutor, as_completed
 import pandas as pd
-from typing import Dict, Any
+import numpy as np
+from typing import Dict, Any, Optional, Tuple, Type
+
+# OHLCV data and indicator cache shared by all runs in a
+# ``BacktestEngine.run_many`` worker process
+_worker_df: Optional[pd.DataFrame] = None
+_worker_indicators: Dict[Any, Tuple[pd.DataFrame, pd.DataFrame]] = {}
+
+
+def _init_worker(df: pd.DataFrame):
+    """Store the OHLCV data once per worker process"""
+    global _worker_df, _worker_indicators
+    _worker_df = df
+    _worker_indicators = {}
+
+
+def _run_config(
+    engine_config: Dict[str, Any],
+    strategy_class: Type[BaseStrategy],
+    strategy_config: Dict[str, Any],
+    metrics_only: bool = False,
+) -> Dict[str, Any]:
+    """Run a single backtest in a worker process on the shared data"""
+    engine = BacktestEngine(engine_config)
+    results = engine.run(
+        _worker_df,
+        strategy_class(strategy_config),
+        validate=False,
+        indicator_cache=_worker_indicators,
+    )
+    if metrics_only:
+        return _strip_curves(results)
+    return results
+
+
+def _strip_curves(results: Dict[str, Any]) -> Dict[str, Any]:
+    """Drop the equity curve and trade list from backtest results"""
+    return {k: v for k, v in results.items() if k not in ("equity_curve", "trades")}
 
 
 class BacktestEngine(BaseBacktest):
@@ -13,35 +52,134 @@ class BacktestEngine(BaseBacktest):
         super().__init__(config)
         self.initial_capital = config.get("initial_capital", 10000.0)
 
-    def run(self, df: pd.DataFrame, strategy: BaseStrategy) -> Dict[str, Any]:
+    def run(
+        self,
+        df: pd.DataFrame,
+        strategy: BaseStrategy,
+        validate: bool = True,
+        indicator_cache: Optional[Dict[Any, Tuple[pd.DataFrame, pd.DataFrame]]] = None,
+    ) -> Dict[str, Any]:
         """Run backtest with given strategy and data
 
         Args:
             df: OHLCV data
             strategy: Strategy instance
+            validate: Validate the data first (skip when the same data was
+                already validated, e.g. across a parameter sweep)
+            indicator_cache: Indicator frames shared between runs, keyed by
+                ``id(df)`` and ``strategy.indicator_key()``. Each entry keeps
+                the source frame and is only reused for that same object.
+                Indicators are taken from it when present and stored in it
+                after being calculated; the caller owns its lifetime.
 
         Returns:
             Dictionary with backtest results
         """
         # Validate data
-        self.validate_data(df)
+        if validate:
+            self.validate_data(df)
 
         # Reset strategy state
         strategy.reset_state()
 
-        # Calculate indicators
-        df = strategy.calculate_indicators(df)
+        # Calculate indicators (or reuse them from an earlier run)
+        key = strategy.indicator_key() if indicator_cache is not None else None
+        if key is not None:
+            # Entries hold their source frame, so its id cannot be reused by
+            # another frame while cached; the identity check guards the rest
+            key = (id(df), key)
+            cached = indicator_cache.get(key)
+            if cached is not None and cached[0] is df:
+                df = cached[1]
+            else:
+                indicators = strategy.calculate_indicators(df)
+                indicator_cache[key] = (df, indicators)
+                df = indicators
+        else:
+            df = strategy.calculate_indicators(df)
 
         # Generate signals
         df = strategy.generate_signals(df)
 
         # Execute trades
-        for i in range(len(df)):
-            strategy.execute_trade(df, i)
+        strategy.execute_trades(df)
 
         # Calculate metrics
         metrics = strategy.calculate_metrics()
-        metrics["equity_curve"] = strategy.equity_curve
+        # Results keep a plain list so analytics and JSON exports work unchanged
+        equity_curve = strategy.equity_curve
+        if isinstance(equity_curve, np.ndarray):
+            equity_curve = equity_curve.tolist()
+        metrics["equity_curve"] = equity_curve
         metrics["trades"] = strategy.trades
 
         return metrics
+
+    def run_many(
+        self,
+        df: pd.DataFrame,
+        strategy_class: Type[BaseStrategy],
+        configs: Dict[str, Dict[str, Any]],
+        max_workers: Optional[int] = None,
+        metrics_only: bool = False,
+    ) -> Dict[str, Dict[str, Any]]:
+        """Run one backtest per strategy config in parallel processes
+
+        Each config is an independent backtest on the same data, so the runs
+        are spread over a process pool. The data is validated once here and
+        sent to each worker once through the pool initializer rather than
+        with every task.
+        Each worker caches indicators by ``indicator_key()``, so configs that
+        share indicator periods compute them once per worker. The caches only
+        cover this call's frame and are dropped when it returns.
+
+        Args:
+            df: OHLCV data
+            strategy_class: Strategy class, instantiated with each config
+            configs: Strategy configs keyed by run name
+            max_workers: Number of worker processes (defaults to one per
+                config, capped at the CPU count)
+            metrics_only: Return only the summary metrics of each run, without
+                equity curves and trades (cheaper to send back from workers
+                when sweeping many configs)
+
+        Returns:
+            Dictionary of backtest results keyed by run name, in the order
+            of ``configs``
+        """
+        self.validate_data(df)
+
+        if max_workers is None:
+            max_workers = min(len(configs), os.cpu_count() or 1)
+
+        if max_workers <= 1:
+            indicator_cache = {}
+            results = {
+                name: self.run(
+                    df,
+                    strategy_class(config),
+                    validate=False,
+                    indicator_cache=indicator_cache,
+                )
+                for name, config in configs.items()
+            }
+            if metrics_only:
+                results = {name: _strip_curves(r) for name, r in results.items()}
+            return results
+
+        results = {}
+        with ProcessPoolExecutor(
+            max_workers=max_workers,
+            initializer=_init_worker,
+            initargs=(df,),
+        ) as executor:
+            futures = {
+                executor.submit(
+                    _run_config, self.config, strategy_class, config, metrics_only
+                ): name
+                for name, config in configs.items()
+            }
+            for future in as_completed(futures):
+                results[futures[future]] = future.result()
+
+        return {name: results[name] for name in configs}
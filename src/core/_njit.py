@@ -0,0 +1,37 @@
+"""Optional Numba JIT compilation
+
+Numerical kernels are decorated with ``njit`` from this module. When numba
+is installed they are compiled to native code; otherwise the decorator is a
+no-op and the kernels run as plain Python over NumPy arrays.
+"""
+
+import warnings
+
+try:
+    from numba import njit, prange
+
+    NUMBA_AVAILABLE = True
+except ImportError:
+    NUMBA_AVAILABLE = False
+
+    warnings.warn(
+        "numba is not installed; backtest kernels run as plain Python and are "
+        "much slower (install the project dependencies with 'uv sync')",
+        RuntimeWarning,
+        stacklevel=2,
+    )
+
+    prange = range
+
+    def njit(*args, **kwargs):
+        """No-op replacement for numba.njit (supports bare and called forms)"""
+        if len(args) == 1 and callable(args[0]) and not kwargs:
+            return args[0]
+
+        def decorator(func):
+            return func
+
+        return decorator
+
+
+__all__ = ["njit", "prange", "NUMBA_AVAILABLE"]
@@ -1,10 +1,12 @@
 """Abstract base class for all trading strategies"""
 
 from abc import ABC, abstractmethod
-from typing import Dict, Any, Optional
+from typing import Dict, Any, List, Optional, Tuple
 import pandas as pd
 import numpy as np
 
+from .kernels import EXIT_REASONS, TRADE_SIDES, equity_stats
+
 
 class BaseStrategy(ABC):
     """Abstract base class for all trading strategies
@@ -13,6 +15,11 @@ class BaseStrategy(ABC):
     the required abstract methods.
     """
 
+    # Config keys that calculate_indicators depends on. Setting this lets
+    # BacktestEngine reuse indicators across configs that differ only in
+    # other parameters (stops, thresholds, sizing).
+    INDICATOR_PARAMS: Tuple[str, ...] = ()
+
     def __init__(self, config: Dict[str, Any]):
         """Initialize strategy with configuration
 
@@ -60,10 +67,13 @@ class BaseStrategy(ABC):
         """
         pass
 
-    @abstractmethod
     def execute_trade(self, df: pd.DataFrame, index: int) -> Optional[Dict]:
         """Execute trade logic for a specific bar
 
+        Called by the default ``execute_trades`` loop. Strategies that
+        simulate all bars at once override ``execute_trades`` instead and
+        need not implement this.
+
         Args:
             df: DataFrame with indicators and signals
             index: Current bar index
@@ -71,7 +81,79 @@ class BaseStrategy(ABC):
         Returns:
             Trade dictionary if trade executed, None otherwise
         """
-        pass
+        raise NotImplementedError(
+            f"{type(self).__name__} must implement execute_trade or execute_trades"
+        )
+
+    def indicator_key(self) -> Optional[tuple]:
+        """Key identifying the indicator columns this config produces
+
+        Returns:
+            Tuple of the strategy class and its ``INDICATOR_PARAMS`` values,
+            or None if the strategy does not declare them
+        """
+        if not self.INDICATOR_PARAMS:
+            return None
+        return (type(self),) + tuple(self.config.get(k) for k in self.INDICATOR_PARAMS)
+
+    @staticmethod
+    def add_columns(df: pd.DataFrame, columns: Dict[str, Any]) -> pd.DataFrame:
+        """Add (or replace) several columns at once
+
+        Inserting columns one at a time costs a block insert each; a single
+        concat adds them all in one step.
+
+        Args:
+            df: DataFrame to extend
+            columns: Column name -> array-like with one value per row
+
+        Returns:
+            New DataFrame with the columns appended
+        """
+        existing = df.columns.intersection(list(columns))
+        if len(existing):
+            df = df.drop(columns=existing)
+
+        return pd.concat([df, pd.DataFrame(columns, index=df.index)], axis=1)
+
+    def get_warmup_bars(self, df: pd.DataFrame) -> int:
+        """Number of leading bars that cannot open a trade
+
+        Indicators need a warm-up window (EMA/ATR/RSI/volume averages) and no
+        entry signal can fire before they are valid, so every bar before the
+        first long or short signal is a no-op apart from recording equity.
+
+        Args:
+            df: DataFrame with signal columns
+
+        Returns:
+            Index of the first bar with an entry signal (len(df) if none)
+        """
+        if "long_signal" not in df.columns or "short_signal" not in df.columns:
+            return 0
+
+        long_signal = df["long_signal"].to_numpy(dtype=bool)
+        short_signal = df["short_signal"].to_numpy(dtype=bool)
+        has_signal = long_signal | short_signal
+        if not has_signal.any():
+            return len(df)
+
+        return int(has_signal.argmax())
+
+    def execute_trades(self, df: pd.DataFrame):
+        """Execute trade logic over all bars
+
+        Bars before ``get_warmup_bars`` only record starting capital;
+        ``execute_trade`` runs from the first bar that can trade.
+
+        Args:
+            df: DataFrame with indicators and signals
+        """
+        warmup = self.get_warmup_bars(df)
+        self.equity_curve.extend([self.capital] * warmup)
+
+        for i in range(warmup, len(df)):
+            self.execute_trade(df, i)
 
     def validate_config(self, config: Dict[str, Any]) -> bool:
         """Validate strategy configuration
@@ -159,6 +241,72 @@ class BaseStrategy(ABC):
 
         return trade
 
+    @staticmethod
+    def trades_from_arrays(
+        index: pd.Index,
+        n_trades: int,
+        entry_price: np.ndarray,
+        exit_price: np.ndarray,
+        trade_size: np.ndarray,
+        pnl: np.ndarray,
+        reason: np.ndarray,
+        side: np.ndarray,
+        entry_bar: np.ndarray,
+        exit_bar: np.ndarray,
+    ) -> List[Dict]:
+        """Build trade dictionaries from a kernel's trade arrays
+
+        Columns are converted in bulk and entry/exit times are looked up
+        with one index take each, instead of per trade.
+
+        Args:
+            index: Bar timestamps of the backtested data
+            n_trades: Number of valid entries in the trade arrays
+            entry_price, exit_price, trade_size, pnl: Per-trade values
+            reason: Exit reason codes (see ``EXIT_REASONS``)
+            side: Trade side codes (see ``TRADE_SIDES``)
+            entry_bar, exit_bar: Bar positions of entries and exits
+
+        Returns:
+            List of trade dictionaries, as recorded by ``close_position``
+        """
+        n = n_trades
+        pnl = pnl[:n]
+        entry_price = entry_price[:n]
+        pnl_pct = pnl / (entry_price * trade_size[:n]) * 100
+
+        return [
+            {
+                "entry": entry,
+                "exit": exit_,
+                "pnl": trade_pnl,
+                "reason": EXIT_REASONS[code],
+                "type": TRADE_SIDES[direction],
+                "pnl_pct": trade_pnl_pct,
+                "entry_time": entry_time,
+                "exit_time": exit_time,
+            }
+            for (
+                entry,
+                exit_,
+                trade_pnl,
+                code,
+                direction,
+                trade_pnl_pct,
+                entry_time,
+                exit_time,
+            ) in zip(
+                entry_price.tolist(),
+                exit_price[:n].tolist(),
+                pnl.tolist(),
+                reason[:n].tolist(),
+                side[:n].tolist(),
+                pnl_pct.tolist(),
+                index[entry_bar[:n]],
+                index[exit_bar[:n]],
+            )
+        ]
+
     def calculate_metrics(self) -> Dict[str, float]:
         """Calculate performance metrics from backtest results
 
@@ -175,23 +323,29 @@ class BaseStrategy(ABC):
                 "final_capital": self.capital,
             }
 
-        # Calculate returns
-        returns = np.diff(self.equity_curve) / np.array(self.equity_curve[:-1])
+        # Return mean/std and max drawdown in one pass over the equity curve
+        equity_array = np.asarray(self.equity_curve, dtype=np.float64)
+        mean_return, std_return, max_drawdown = equity_stats(equity_array)
+        n_returns = len(equity_array) - 1
 
         # Sharpe ratio
-        if len(returns) > 1 and returns.std() != 0:
-            sharpe = (returns.mean() / returns.std()) * (len(returns) ** 0.5)
+        if n_returns > 1 and std_return != 0:
+            sharpe = (mean_return / std_return) * (n_returns**0.5)
         else:
             sharpe = 0.0
 
         # Max drawdown
-        equity_array = np.array(self.equity_curve)
-        running_max = np.maximum.accumulate(equity_array)
-        drawdown = (equity_array - running_max) / running_max * 100
-        max_drawdown = drawdown.min()
+        max_drawdown = max_drawdown * 100
+
+        # Trade PnLs as one contiguous array for all trade statistics
+        pnl = np.fromiter(
+            (t["pnl"] for t in self.trades), dtype=np.float64, count=len(self.trades)
+        )
+        winning_trades = pnl[pnl > 0]
+        losing_trades = pnl[pnl < 0]
 
         # Win rate
-        win_rate = sum(1 for t in self.trades if t["pnl"] > 0) / len(self.trades) * 100
+        win_rate = (pnl > 0).mean() * 100
 
         # Total return
         total_return = (
@@ -199,16 +353,13 @@ class BaseStrategy(ABC):
         )
 
         # Profit factor
-        winning_trades = [t["pnl"] for t in self.trades if t["pnl"] > 0]
-        losing_trades = [t["pnl"] for t in self.trades if t["pnl"] < 0]
-
-        if losing_trades:
-            profit_factor = sum(winning_trades) / abs(sum(losing_trades))
+        if losing_trades.size:
+            profit_factor = winning_trades.sum() / abs(losing_trades.sum())
         else:
-            profit_factor = float("inf") if winning_trades else 0.0
+            profit_factor = float("inf") if winning_trades.size else 0.0
 
         # Average trade
-        avg_trade = np.mean([t["pnl"] for t in self.trades])
+        avg_trade = pnl.mean()
 
         return {
             "total_return": total_return,
@@ -219,9 +370,18 @@ class BaseStrategy(ABC):
             "final_capital": self.capital,
             "profit_factor": profit_factor,
             "avg_trade": avg_trade,
-            "total_pnl": sum(t["pnl"] for t in self.trades),
+            "total_pnl": pnl.sum(),
         }
 
+    @property
+    def trades_df(self) -> pd.DataFrame:
+        """Trades as a columnar DataFrame (one row per trade)
+
+        Returns:
+            DataFrame built from the trade records, empty if no trades
+        """
+        return pd.DataFrame(self.trades)
+
     def __repr__(self) -> str:
         return (
             f"{self.__class__.__name__}(name={self.name}, capital={self.capital:.2f})"
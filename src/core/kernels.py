@@ -0,0 +1,510 @@
+"""Compiled backtest kernels operating on NumPy arrays
+
+Kernels take plain contiguous arrays (no pandas objects) so they can be
+JIT-compiled by numba. Exit reasons and trade sides are encoded as integers;
+see ``EXIT_REASONS`` and ``TRADE_SIDES`` for the mapping back to labels.
+"""
+
+import numpy as np
+
+from ._njit import njit, prange
+
+# Exit reason codes used by the kernels
+EXIT_SL = 0
+EXIT_TP = 1
+EXIT_TREND = 2
+
+EXIT_REASONS = {EXIT_SL: "SL", EXIT_TP: "TP", EXIT_TREND: "Trend Change"}
+TRADE_SIDES = {1: "long", -1: "short"}
+
+
+@njit(cache=True)
+def equity_stats(equity):
+    """Mean/std of bar returns and max drawdown in a single pass
+
+    Uses Welford's update for the return variance and tracks the running
+    peak alongside it, so no return, running-max or drawdown arrays are
+    allocated.
+
+    Args:
+        equity: Equity curve (float64)
+
+    Returns:
+        Tuple of (mean_return, std_return, max_drawdown). The standard
+        deviation is the population value (ddof=0) and max_drawdown is a
+        non-positive fraction of the running peak.
+    """
+    n = equity.shape[0]
+    if n == 0:
+        return 0.0, 0.0, 0.0
+
+    running_max = equity[0]
+    max_drawdown = 0.0
+    mean = 0.0
+    m2 = 0.0
+
+    for i in range(1, n):
+        ret = (equity[i] - equity[i - 1]) / equity[i - 1]
+        delta = ret - mean
+        mean += delta / i
+        m2 += delta * (ret - mean)
+
+        if equity[i] > running_max:
+            running_max = equity[i]
+        drawdown = (equity[i] - running_max) / running_max
+        if drawdown < max_drawdown:
+            max_drawdown = drawdown
+
+    if n < 2:
+        return 0.0, 0.0, max_drawdown
+
+    return mean, np.sqrt(m2 / (n - 1)), max_drawdown
+
+
+@njit(cache=True)
+def ema(values, alpha):
+    """Exponential moving average, matching ``ewm(adjust=False).mean()``
+
+    The update is written the same way as pandas' ``ewm`` so results agree to
+    the last bit.
+
+    Args:
+        values: Input series without NaNs (float64)
+        alpha: Smoothing factor, e.g. 2 / (span + 1)
+
+    Returns:
+        Array of EMA values
+    """
+    n = values.shape[0]
+    out = np.empty(n, dtype=np.float64)
+    if n == 0:
+        return out
+
+    old_wt_factor = 1.0 - alpha
+    weighted = values[0]
+    out[0] = weighted
+
+    for i in range(1, n):
+        weighted = (old_wt_factor * weighted + alpha * values[i]) / (
+            old_wt_factor + alpha
+        )
+        out[i] = weighted
+
+    return out
+
+
+@njit(cache=True)
+def simulate(
+    close,
+    long_sig,
+    short_sig,
+    is_bull,
+    is_bear,
+    atr,
+    sl_mult,
+    tp_mult,
+    capital0,
+    size_pct,
+    start=0,
+):
+    """Run the trend-following trade state machine over one price series
+
+    Args:
+        close: Close prices (float64)
+        long_sig: Long entry signals (bool)
+        short_sig: Short entry signals (bool)
+        is_bull: Bullish trend flags, a long exits when this turns False
+        is_bear: Bearish trend flags, a short exits when this turns False
+        atr: ATR values used for stop/target distances (float64)
+        sl_mult: ATR multiplier for the stop loss
+        tp_mult: ATR multiplier for the take profit
+        capital0: Starting capital
+        size_pct: Fraction of capital allocated per trade
+        start: First bar to evaluate (earlier bars keep starting capital)
+
+    Returns:
+        Tuple of (equity, entry_price, exit_price, size, pnl, reason, side,
+        entry_bar, exit_bar, n_trades). Trade arrays are only valid up to
+        ``n_trades``.
+    """
+    n = close.shape[0]
+
+    equity = np.empty(n, dtype=np.float64)
+    entry_price = np.empty(n, dtype=np.float64)
+    exit_price = np.empty(n, dtype=np.float64)
+    trade_size = np.empty(n, dtype=np.float64)
+    pnl = np.empty(n, dtype=np.float64)
+    reason = np.empty(n, dtype=np.int8)
+    side = np.empty(n, dtype=np.int8)
+    entry_bar = np.empty(n, dtype=np.int64)
+    exit_bar = np.empty(n, dtype=np.int64)
+
+    capital = capital0
+    position = 0
+    entry = 0.0
+    size = 0.0
+    stop_loss = 0.0
+    take_profit = 0.0
+    opened_at = 0
+    n_trades = 0
+
+    for i in range(min(start, n)):
+        equity[i] = capital
+
+    for i in range(start, n):
+        price = close[i]
+
+        # Exits first
+        if position != 0:
+            code = -1
+            if position == 1:
+                if price <= stop_loss:
+                    code = EXIT_SL
+                elif price >= take_profit:
+                    code = EXIT_TP
+                elif not is_bull[i]:
+                    code = EXIT_TREND
+            else:
+                if price >= stop_loss:
+                    code = EXIT_SL
+                elif price <= take_profit:
+                    code = EXIT_TP
+                elif not is_bear[i]:
+                    code = EXIT_TREND
+
+            if code >= 0:
+                trade_pnl = (price - entry) * size * position
+                capital += trade_pnl
+
+                entry_price[n_trades] = entry
+                exit_price[n_trades] = price
+                trade_size[n_trades] = size
+                pnl[n_trades] = trade_pnl
+                reason[n_trades] = code
+                side[n_trades] = position
+                entry_bar[n_trades] = opened_at
+                exit_bar[n_trades] = i
+                n_trades += 1
+
+                position = 0
+
+        # Entries
+        if position == 0:
+            if long_sig[i]:
+                position = 1
+                entry = price
+                size = capital * size_pct / price
+                stop_loss = price - atr[i] * sl_mult
+                take_profit = price + atr[i] * tp_mult
+                opened_at = i
+            elif short_sig[i]:
+                position = -1
+                entry = price
+                size = capital * size_pct / price
+                stop_loss = price + atr[i] * sl_mult
+                take_profit = price - atr[i] * tp_mult
+                opened_at = i
+
+        equity[i] = capital
+
+    return (
+        equity,
+        entry_price,
+        exit_price,
+        trade_size,
+        pnl,
+        reason,
+        side,
+        entry_bar,
+        exit_bar,
+        n_trades,
+    )
+
+
+@njit(cache=True, parallel=True)
+def simulate_grid(
+    close,
+    long_sig,
+    short_sig,
+    is_bull,
+    is_bear,
+    atr,
+    sl_mults,
+    tp_mults,
+    size_pcts,
+    capital0,
+    start=0,
+):
+    """Run ``simulate`` for many (sl_mult, tp_mult, size_pct) runs in parallel
+
+    Indicator and signal arrays are shared across runs; only the stop/target
+    multipliers and position size change, so each run is independent and
+    runs on its own core.
+
+    Args:
+        close, long_sig, short_sig, is_bull, is_bear, atr: See ``simulate``
+        sl_mults: Stop-loss multipliers, one per run
+        tp_mults: Take-profit multipliers, same length as ``sl_mults``
+        size_pcts: Fractions of capital allocated per trade, same length as
+            ``sl_mults``
+        capital0: Starting capital
+        start: First bar to evaluate
+
+    Returns:
+        Array of shape (K, 5) with total return (%), Sharpe ratio, max
+        drawdown (%), number of trades and win rate (%) for each run
+    """
+    k_total = sl_mults.shape[0]
+    out = np.zeros((k_total, 5), dtype=np.float64)
+
+    for k in prange(k_total):
+        result = simulate(
+            close,
+            long_sig,
+            short_sig,
+            is_bull,
+            is_bear,
+            atr,
+            sl_mults[k],
+            tp_mults[k],
+            capital0,
+            size_pcts[k],
+            start,
+        )
+        equity = result[0]
+        pnl = result[4]
+        n_trades = result[9]
+        if n_trades == 0:
+            continue
+
+        mean, std, max_drawdown = equity_stats(equity)
+        n_returns = equity.shape[0] - 1
+        sharpe = 0.0
+        if n_returns > 1 and std != 0:
+            sharpe = mean / std * n_returns**0.5
+
+        wins = 0
+        for t in range(n_trades):
+            if pnl[t] > 0:
+                wins += 1
+
+        out[k, 0] = (equity[-1] - capital0) / capital0 * 100
+        out[k, 1] = sharpe
+        out[k, 2] = max_drawdown * 100
+        out[k, 3] = n_trades
+        out[k, 4] = wins / n_trades * 100
+
+    return out
+
+
+@njit(cache=True)
+def _volatility_position_size(capital, price, atr_pct, base_pct):
+    """Position size scaled down in high volatility and up in low volatility"""
+    if atr_pct > 1.0:
+        size_pct = base_pct * 0.8
+    elif atr_pct > 0.5:
+        size_pct = base_pct
+    else:
+        size_pct = base_pct * 1.2
+
+    return capital * size_pct / price
+
+
+@njit(cache=True)
+def simulate_scaled(
+    close,
+    long_sig,
+    short_sig,
+    scale_long_2,
+    scale_long_3,
+    scale_short_2,
+    scale_short_3,
+    is_bull,
+    is_bear,
+    atr_pct,
+    sl_dist,
+    tp_dist,
+    trail_dist,
+    capital0,
+    base_pct,
+    start=0,
+):
+    """Run the scaled-entry, trailing-stop trend state machine
+
+    Positions open at 50% of the volatility-adjusted size, scale in by 30%
+    and 20% on the second and third entry signals, and trail the stop by
+    ``trail_dist`` once price has covered half the distance to target.
+
+    Args:
+        close: Close prices (float64)
+        long_sig, short_sig: Initial entry signals (bool)
+        scale_long_2, scale_long_3: Long scale-in signals (bool)
+        scale_short_2, scale_short_3: Short scale-in signals (bool)
+        is_bull, is_bear: Trend flags used for trend-change exits (bool)
+        atr_pct: ATR as percent of price, used for position sizing
+        sl_dist, tp_dist: Stop-loss / take-profit distances at entry
+        trail_dist: Trailing stop distance
+        capital0: Starting capital
+        base_pct: Base fraction of capital per position
+        start: First bar to evaluate (earlier bars keep starting capital)
+
+    Returns:
+        Tuple of (equity, entry_price, exit_price, size, pnl, reason, side,
+        entry_bar, exit_bar, scales, scale_prices, n_trades). entry_price is
+        the size-weighted average entry and scale_prices has shape (n, 3).
+        Trade arrays are only valid up to ``n_trades``.
+    """
+    n = close.shape[0]
+
+    equity = np.empty(n, dtype=np.float64)
+    entry_price = np.empty(n, dtype=np.float64)
+    exit_price = np.empty(n, dtype=np.float64)
+    trade_size = np.empty(n, dtype=np.float64)
+    pnl = np.empty(n, dtype=np.float64)
+    reason = np.empty(n, dtype=np.int8)
+    side = np.empty(n, dtype=np.int8)
+    entry_bar = np.empty(n, dtype=np.int64)
+    exit_bar = np.empty(n, dtype=np.int64)
+    scales = np.empty(n, dtype=np.int8)
+    scale_prices = np.zeros((n, 3), dtype=np.float64)
+
+    capital = capital0
+    position = 0
+    entry = 0.0
+    size = 0.0
+    stop_loss = 0.0
+    take_profit = 0.0
+    trailing = False
+    current_scale = 0
+    scale_1 = 0.0
+    scale_2 = 0.0
+    scale_3 = 0.0
+    opened_at = 0
+    n_trades = 0
+
+    for i in range(min(start, n)):
+        equity[i] = capital
+
+    for i in range(start, n):
+        price = close[i]
+
+        # Exits first
+        if position != 0:
+            code = -1
+            half_target = entry + (take_profit - entry) * 0.5
+
+            if position == 1:
+                if not trailing and price >= half_target:
+                    trailing = True
+                if trailing:
+                    new_trail = price - trail_dist[i]
+                    if new_trail > stop_loss:
+                        stop_loss = new_trail
+
+                if price <= stop_loss:
+                    code = EXIT_SL
+                elif price >= take_profit:
+                    code = EXIT_TP
+                elif not is_bull[i]:
+                    code = EXIT_TREND
+            else:
+                if not trailing and price <= half_target:
+                    trailing = True
+                if trailing:
+                    new_trail = price + trail_dist[i]
+                    if new_trail < stop_loss:
+                        stop_loss = new_trail
+
+                if price >= stop_loss:
+                    code = EXIT_SL
+                elif price <= take_profit:
+                    code = EXIT_TP
+                elif not is_bear[i]:
+                    code = EXIT_TREND
+
+            if code >= 0:
+                trade_pnl = (price - entry) * size * position
+                capital += trade_pnl
+
+                entry_price[n_trades] = entry
+                exit_price[n_trades] = price
+                trade_size[n_trades] = size
+                pnl[n_trades] = trade_pnl
+                reason[n_trades] = code
+                side[n_trades] = position
+                entry_bar[n_trades] = opened_at
+                exit_bar[n_trades] = i
+                scales[n_trades] = current_scale
+                scale_prices[n_trades, 0] = scale_1
+                scale_prices[n_trades, 1] = scale_2
+                scale_prices[n_trades, 2] = scale_3
+                n_trades += 1
+
+                position = 0
+
+        if position == 0:
+            # Initial entry (50% of base position)
+            direction = 0
+            if long_sig[i]:
+                direction = 1
+            elif short_sig[i]:
+                direction = -1
+
+            if direction != 0:
+                base_size = _volatility_position_size(
+                    capital, price, atr_pct[i], base_pct
+                )
+                position = direction
+                entry = price
+                size = base_size * 0.5
+                scale_1 = price
+                current_scale = 1
+                stop_loss = price - sl_dist[i] * direction
+                take_profit = price + tp_dist[i] * direction
+                trailing = False
+                opened_at = i
+
+        elif current_scale < 3:
+            # Scale-in opportunities (second and third entries)
+            if position == 1:
+                add_2 = scale_long_2[i]
+                add_3 = scale_long_3[i]
+            else:
+                add_2 = scale_short_2[i]
+                add_3 = scale_short_3[i]
+
+            fraction = 0.0
+            if add_2 and current_scale == 1:
+                fraction = 0.3
+            elif add_3 and current_scale == 2:
+                fraction = 0.2
+
+            if fraction > 0.0:
+                base_size = _volatility_position_size(
+                    capital, price, atr_pct[i], base_pct
+                )
+                scale_size = base_size * fraction
+                entry = ((entry * size) + (price * scale_size)) / (size + scale_size)
+                size += scale_size
+                current_scale += 1
+                if current_scale == 2:
+                    scale_2 = price
+                else:
+                    scale_3 = price
+
+        equity[i] = capital
+
+    return (
+        equity,
+        entry_price,
+        exit_price,
+        trade_size,
+        pnl,
+        reason,
+        side,
+        entry_bar,
+        exit_bar,
+        scales,
+        scale_prices,
+        n_trades,
+    )
@@ -1,26 +1,45 @@
 """Universal data fetcher for crypto exchanges"""
 
 import ccxt
+import numpy as np
 import pandas as pd
-from datetime import datetime, timedelta
+from datetime import date, datetime, timedelta
+from pathlib import Path
 from typing import List, Dict, Optional
 
+# One ccxt client per exchange, shared by all DataFetcher instances in a process
+_EXCHANGES: Dict[str, ccxt.Exchange] = {}
+
+
+def _get_exchange(name: str) -> ccxt.Exchange:
+    """Return the shared ccxt client for an exchange, creating it on first use
+
+    Reusing the client keeps its loaded markets and HTTP session (keep-alive
+    connections) across fetches instead of rebuilding them per fetcher.
+    """
+    if name not in _EXCHANGES:
+        _EXCHANGES[name] = getattr(ccxt, name)({"enableRateLimit": True})
+    return _EXCHANGES[name]
+
 
 class DataFetcher:
     """Universal data fetcher for multiple exchanges and timeframes
 
     Supports Binance, Coinbase, Kraken, Bybit and other ccxt-supported exchanges.
-    Fetches OHLCV data for any symbol and timeframe.
+    Fetches OHLCV data for any symbol and timeframe. Fetched data is cached
+    as Parquet under ``cache_dir`` so repeated runs skip the download.
     """
 
     SUPPORTED_EXCHANGES = ["binance", "coinbase", "kraken", "bybit", "okx", "kucoin"]
     SUPPORTED_TIMEFRAMES = ["1m", "5m", "15m", "1h", "4h", "1d", "1w", "1M"]
 
-    def __init__(self, exchange: str = "binance"):
+    def __init__(self, exchange: str = "binance", cache_dir: Optional[str] = "cache"):
         """Initialize data fetcher
 
         Args:
             exchange: Exchange name (default: binance)
+            cache_dir: Directory for cached OHLCV Parquet files
+                (default: cache, None disables caching)
 
         Raises:
             ValueError: If exchange is not supported
@@ -34,8 +53,8 @@ class DataFetcher:
             )
 
         self.exchange_name = exchange
-        self.exchange = getattr(ccxt, exchange)()
-        self.exchange.enable_rate_limit = True
+        self.exchange = _get_exchange(exchange)
+        self.cache_dir = Path(cache_dir) if cache_dir else None
 
     def fetch(
         self,
@@ -75,6 +94,18 @@ class DataFetcher:
             end_dt = datetime.now()
             start_dt = end_dt - timedelta(days=period_days)
 
+        # Use cached data when this request was already fetched
+        cache_path = self._cache_path(
+            symbol, timeframe, period_days, start_date, end_date
+        )
+        if cache_path is not None and cache_path.exists():
+            df = pd.read_parquet(cache_path)
+            print(
+                f"Loaded {len(df)} {timeframe} candles for {symbol} from cache "
+                f"({cache_path})"
+            )
+            return df
+
         start_time = int(start_dt.timestamp() * 1000)
         end_time = int(end_dt.timestamp() * 1000)
 
@@ -82,6 +113,7 @@ class DataFetcher:
         all_ohlcv = []
         current_time = start_time
         limit = 1000  # Max candles per request
+        complete = True  # False if paging stopped on an error
 
         while current_time < end_time:
             try:
@@ -103,6 +135,7 @@ class DataFetcher:
 
             except Exception as e:
                 print(f"Warning: Error fetching data: {e}")
+                complete = False
                 break
 
         if len(all_ohlcv) == 0:
@@ -118,18 +151,59 @@ class DataFetcher:
         df.set_index("timestamp", inplace=True)
 
         # Remove duplicates (can happen with overlapping requests)
-        df = df[~df.index.duplicated(keep="first")]
+        if df.index.has_duplicates:
+            df = df[~df.index.duplicated(keep="first")]
 
-        # Sort by index
-        df.sort_index(inplace=True)
+        # Sort by index (paged fetches normally arrive in order already)
+        if not df.index.is_monotonic_increasing:
+            df.sort_index(inplace=True)
 
         print(
             f"Fetched {len(df)} {timeframe} candles for {symbol} from {self.exchange_name}"
         )
         print(f"Date range: {df.index.min()} to {df.index.max()}")
 
+        # A download cut short by an error is returned but not cached, so
+        # later runs fetch the full range again instead of reusing the gap
+        if cache_path is not None and complete:
+            self._write_cache(df, cache_path)
+        elif cache_path is not None:
+            print(f"Warning: Incomplete download, not caching {cache_path}")
+
         return df
 
+    def _cache_path(
+        self,
+        symbol: str,
+        timeframe: str,
+        period_days: int,
+        start_date: Optional[str],
+        end_date: Optional[str],
+    ) -> Optional[Path]:
+        """Cache file for a fetch request, or None if caching is disabled
+
+        Requests relative to now are keyed by today's date, so the cache is
+        refreshed once per day.
+        """
+        if self.cache_dir is None:
+            return None
+
+        if start_date and end_date:
+            span = f"{start_date}_{end_date}"
+        else:
+            span = f"{period_days}d_{date.today().isoformat()}"
+
+        name = f"{self.exchange_name}_{symbol.replace('/', '_')}_{timeframe}_{span}"
+        return self.cache_dir / f"{name.replace(':', '-')}.parquet"
+
+    def _write_cache(self, df: pd.DataFrame, cache_path: Path):
+        """Write fetched data to the Parquet cache (best effort)"""
+        try:
+            cache_path.parent.mkdir(parents=True, exist_ok=True)
+            df.to_parquet(cache_path, compression="snappy")
+        except (ImportError, OSError) as e:
+            print(f"Warning: Could not cache data to {cache_path}: {e}")
+
     def fetch_multiple(
         self, symbols: List[str], timeframe: str, **kwargs
     ) -> Dict[str, pd.DataFrame]:
@@ -167,24 +241,24 @@ class DataFetcher:
         Returns:
             Dictionary with Buy & Hold metrics
         """
-        start_price = df["close"].iloc[0]
-        end_price = df["close"].iloc[-1]
+        close = df["close"].to_numpy(dtype=np.float64)
+        start_price = close[0]
+        end_price = close[-1]
 
         total_return = (end_price - start_price) / start_price * 100
         final_value = initial_capital * (end_price / start_price)
 
-        # Calculate returns for Sharpe
-        df["returns"] = df["close"].pct_change().fillna(0)
+        # Calculate returns for Sharpe (first bar has no return)
+        returns_array = np.zeros_like(close)
+        returns_array[1:] = close[1:] / close[:-1] - 1
 
         # Calculate max drawdown
-        cumulative = (1 + df["returns"]).cumprod()
-        running_max = cumulative.expanding().max()
+        cumulative = np.cumprod(1 + returns_array)
+        running_max = np.maximum.accumulate(cumulative)
         drawdown = (cumulative - running_max) / running_max * 100
         max_drawdown = drawdown.min()
 
         # Calculate Sharpe ratio (annualized)
-        returns_array = df["returns"].values
-
         if len(returns_array) > 1 and returns_array.std() != 0:
             sharpe = (returns_array.mean() / returns_array.std()) * (
                 len(returns_array) ** 0.5
@@ -14,7 +14,12 @@ class SplitMethod(Enum):
 
 
 class TrainTestSplitter:
-    """Split data into training and testing sets"""
+    """Split data into training and testing sets
+
+    Splits are ``iloc`` slices of the input rather than copies. Strategies
+    and the backtest engine treat their input frame as read-only, so the
+    OHLCV data need not be duplicated for every window.
+    """
 
     @staticmethod
     def split_sequential(
@@ -30,8 +35,8 @@ class TrainTestSplitter:
             Tuple of (train_df, test_df)
         """
         split_idx = int(len(df) * train_pct)
-        train_df = df.iloc[:split_idx].copy()
-        test_df = df.iloc[split_idx:].copy()
+        train_df = df.iloc[:split_idx]
+        test_df = df.iloc[split_idx:]
 
         print(f"Train: {len(train_df)} bars ({len(train_df) / len(df) * 100:.1f}%)")
         print(f"Test: {len(test_df)} bars ({len(test_df) / len(df) * 100:.1f}%)")
@@ -67,8 +72,8 @@ class TrainTestSplitter:
             train_end = start_idx + train_size
             test_end = train_end + test_size
 
-            train_df = df.iloc[start_idx:train_end].copy()
-            test_df = df.iloc[train_end:test_end].copy()
+            train_df = df.iloc[start_idx:train_end]
+            test_df = df.iloc[train_end:test_end]
 
             splits.append((train_df, test_df))
 
@@ -98,8 +103,8 @@ class TrainTestSplitter:
             test_end = (i + 1) * fold_size if i < n_folds - 1 else len(df)
 
             # Train = all except test fold
-            train_df = pd.concat([df.iloc[:test_start], df.iloc[test_end:]]).copy()
-            test_df = df.iloc[test_start:test_end].copy()
+            train_df = pd.concat([df.iloc[:test_start], df.iloc[test_end:]])
+            test_df = df.iloc[test_start:test_end]
 
             splits.append((train_df, test_df))
 
@@ -1,6 +1,7 @@
 """Average Directional Index indicator"""
 
 from ..core.base_indicator import BaseIndicator
+from .atr import true_range
 import pandas as pd
 
 
@@ -22,7 +23,6 @@ class ADX(BaseIndicator):
 
         high = df["high"]
         low = df["low"]
-        close = df["close"]
 
         # Calculate directional movement
         plus_dm = high.diff()
@@ -34,10 +34,7 @@ class ADX(BaseIndicator):
         minus_dm = -minus_dm
 
         # Calculate True Range
-        tr1 = high - low
-        tr2 = abs(high - close.shift(1))
-        tr3 = abs(low - close.shift(1))
-        tr = pd.concat([tr1, tr2, tr3], axis=1).max(axis=1)
+        tr = pd.Series(true_range(df), index=df.index)
 
         # Smooth True Range
         atr = tr.rolling(window=period).mean()
@@ -1,19 +1,52 @@
 """Average True Range indicator"""
 
 from ..core.base_indicator import BaseIndicator
+from ..core._njit import NUMBA_AVAILABLE
+from ..core.kernels import ema
 import pandas as pd
 import numpy as np
 
 
+def true_range(df: pd.DataFrame) -> np.ndarray:
+    """Calculate True Range on NumPy arrays
+
+    Args:
+        df: OHLCV DataFrame
+
+    Returns:
+        Array with the True Range of each bar
+    """
+    high = df["high"].to_numpy(dtype=np.float64)
+    low = df["low"].to_numpy(dtype=np.float64)
+    close = df["close"].to_numpy(dtype=np.float64)
+
+    # Previous close (undefined on the first bar)
+    prev_close = np.empty_like(close)
+    prev_close[:1] = np.nan
+    prev_close[1:] = close[:-1]
+
+    # True Range is max of three; fmax skips the missing previous close
+    # on the first bar so it falls back to high - low
+    return np.fmax(
+        high - low, np.fmax(np.abs(high - prev_close), np.abs(low - prev_close))
+    )
+
+
 class ATR(BaseIndicator):
     """Average True Range indicator"""
 
-    def calculate(self, df: pd.DataFrame, period: int = 14, **kwargs) -> pd.Series:
+    def calculate(
+        self, df: pd.DataFrame, period: int = 14, smoothing: str = "sma", **kwargs
+    ) -> pd.Series:
         """Calculate ATR
 
         Args:
             df: OHLCV DataFrame
             period: ATR period
+            smoothing: "sma" for a simple moving average of the true range or
+                "wilder" for Wilder's smoothing (RMA, as TradingView's
+                ta.atr: seeded with the SMA of the first ``period`` true
+                ranges, then an EMA with alpha = 1/period)
             **kwargs: Additional parameters (ignored)
 
         Returns:
@@ -21,20 +54,26 @@ class ATR(BaseIndicator):
         """
         self._validate_period(period)
 
-        high = df["high"]
-        low = df["low"]
-        close = df["close"]
-
-        # Calculate True Range components
-        tr1 = high - low
-        tr2 = abs(high - close.shift(1))
-        tr3 = abs(low - close.shift(1))
-
-        # True Range is max of three
-        tr = pd.concat([tr1, tr2, tr3], axis=1).max(axis=1)
+        tr = true_range(df)
 
         # Average True Range
-        atr = tr.rolling(window=period).mean()
+        if smoothing == "sma":
+            atr = pd.Series(tr, index=df.index).rolling(window=period).mean()
+        elif smoothing == "wilder":
+            atr = np.full(len(tr), np.nan)
+            if len(tr) >= period:
+                # Seed with the SMA of the first period, NaN before it
+                seeded = tr[period - 1 :].copy()
+                seeded[0] = tr[:period].mean()
+                if NUMBA_AVAILABLE:
+                    atr[period - 1 :] = ema(seeded, 1.0 / period)
+                else:
+                    # The ema kernel is a Python loop without numba; use pandas
+                    seeded = pd.Series(seeded).ewm(alpha=1.0 / period, adjust=False)
+                    atr[period - 1 :] = seeded.mean().to_numpy()
+            atr = pd.Series(atr, index=df.index)
+        else:
+            raise ValueError(f"Unknown ATR smoothing: {smoothing}")
 
         return atr
 
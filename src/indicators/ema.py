@@ -1,7 +1,10 @@
 """Exponential Moving Average indicator"""
 
 from ..core.base_indicator import BaseIndicator
+from ..core._njit import NUMBA_AVAILABLE
+from ..core.kernels import ema
 import pandas as pd
+import numpy as np
 
 
 class EMA(BaseIndicator):
@@ -20,10 +23,15 @@ class EMA(BaseIndicator):
         """
         self._validate_period(period)
 
-        # Calculate EMA using pandas ewm
-        ema = df["close"].ewm(span=period, adjust=False).mean()
+        # Without numba the kernel is a Python loop, slower than pandas
+        if not NUMBA_AVAILABLE:
+            return df["close"].ewm(span=period, adjust=False).mean()
 
-        return ema
+        # Compiled recursive EMA, same values as ewm(span=period, adjust=False)
+        close = df["close"].to_numpy(dtype=np.float64)
+        values = ema(close, 2.0 / (period + 1))
+
+        return pd.Series(values, index=df.index, name="close")
 
     def validate_params(self, **kwargs) -> bool:
         """Validate parameters"""
@@ -1,6 +1,8 @@
 """Relative Strength Index indicator"""
 
 from ..core.base_indicator import BaseIndicator
+from ..core._njit import NUMBA_AVAILABLE
+from ..core.kernels import ema
 import pandas as pd
 import numpy as np
 
@@ -21,22 +23,30 @@ class RSI(BaseIndicator):
         """
         self._validate_period(period)
 
-        # Calculate price changes
-        delta = df["close"].diff()
+        close = df["close"].to_numpy(dtype=np.float64)
+
+        # Calculate price changes (first bar has no change)
+        delta = np.diff(close, prepend=close[:1])
 
         # Separate gains and losses
-        gain = delta.where(delta > 0, 0)
-        loss = -delta.where(delta < 0, 0)
+        gain = np.maximum(delta, 0.0)
+        loss = np.maximum(-delta, 0.0)
 
-        # Use Wilder's smoothing (ewm with alpha = 1/period)
+        # Use Wilder's smoothing (EMA with alpha = 1/period)
+        # (pandas ewm without numba, where the kernel is a Python loop)
         alpha = 1.0 / period
-        avg_gain = gain.ewm(alpha=alpha, adjust=False).mean()
-        avg_loss = loss.ewm(alpha=alpha, adjust=False).mean()
+        if NUMBA_AVAILABLE:
+            avg_gain = ema(gain, alpha)
+            avg_loss = ema(loss, alpha)
+        else:
+            avg_gain = pd.Series(gain).ewm(alpha=alpha, adjust=False).mean().to_numpy()
+            avg_loss = pd.Series(loss).ewm(alpha=alpha, adjust=False).mean().to_numpy()
 
         # Calculate RS
         # When avg_loss is 0, RSI should be 100 (no losses)
         # When both are 0, RSI should be 50 (neutral)
-        rs = avg_gain / avg_loss.replace(0, np.nan)
+        with np.errstate(divide="ignore", invalid="ignore"):
+            rs = avg_gain / np.where(avg_loss == 0, np.nan, avg_loss)
 
         # Calculate RSI
         rsi = 100 - (100 / (1 + rs))
@@ -45,10 +55,10 @@ class RSI(BaseIndicator):
         # When avg_loss is 0 (all gains), RSI = 100
         # When avg_gain is 0 (all losses), RSI = 0
         # When both are 0, RSI = 50
-        rsi = rsi.where(avg_loss != 0, 100)  # When loss is 0, RSI = 100
-        rsi = rsi.where((avg_gain != 0) | (avg_loss != 0), 50)  # When both 0, RSI = 50
+        rsi = np.where(avg_loss != 0, rsi, 100.0)  # When loss is 0, RSI = 100
+        rsi = np.where((avg_gain != 0) | (avg_loss != 0), rsi, 50.0)  # Both 0 -> 50
 
-        return rsi
+        return pd.Series(rsi, index=df.index, name="close")
 
     def validate_params(self, **kwargs) -> bool:
         """Validate parameters"""
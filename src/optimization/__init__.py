@@ -1,7 +1,11 @@
 """Optimization methods"""
 
 from .bayesian_opt import BayesianOptimizer
+from .grid_search import GridSearchOptimizer
+from .random_search import RandomSearchOptimizer
 
 __all__ = [
     "BayesianOptimizer",
+    "GridSearchOptimizer",
+    "RandomSearchOptimizer",
 ]
@@ -70,7 +70,7 @@ class BayesianOptimizer:
             # Run backtest
             strategy = self.strategy_class(config)
             engine = BacktestEngine(self.engine_config)
-            results = engine.run(self.df, strategy)
+            results = engine.run(self.df, strategy, validate=False)
 
             # Return objective (Sharpe ratio)
             if direction == "maximize":
@@ -78,11 +78,21 @@ class BayesianOptimizer:
             else:
                 return -results["sharpe_ratio"]
 
-        # Create study
-        study = optuna.create_study(direction="maximize")
-
-        # Optimize
-        study.optimize(objective, n_trials=self.n_trials, show_progress_bar=True)
+        # Data is the same for every trial, so validate it once
+        BacktestEngine(self.engine_config).validate_data(self.df)
+
+        # Per-trial log lines duplicate the progress bar; only show warnings
+        # while this study runs, then restore the caller's verbosity
+        verbosity = optuna.logging.get_verbosity()
+        optuna.logging.set_verbosity(optuna.logging.WARNING)
+        try:
+            # Create study
+            study = optuna.create_study(direction="maximize")
+
+            # Optimize
+            study.optimize(objective, n_trials=self.n_trials, show_progress_bar=True)
+        finally:
+            optuna.logging.set_verbosity(verbosity)
 
         # Get best results
         best_params = study.best_params
@@ -0,0 +1,180 @@
+"""Exhaustive grid search over strategy parameters"""
+
+import itertools
+import numpy as np
+import pandas as pd
+from typing import Dict, Any, List, Optional
+from ..backtest import BacktestEngine
+
+
+class GridSearchOptimizer:
+    """Grid search over every combination of parameter values
+
+    Each combination is an independent backtest on the same data, so the
+    grid is evaluated in parallel worker processes.
+    """
+
+    def __init__(
+        self,
+        strategy_class,
+        df: pd.DataFrame,
+        param_grid: Dict[str, List[Any]],
+        engine_config: Optional[Dict[str, Any]] = None,
+        base_config: Optional[Dict[str, Any]] = None,
+        n_jobs: Optional[int] = None,
+    ):
+        """Initialize grid search optimizer
+
+        Args:
+            strategy_class: Strategy class to optimize
+            df: OHLCV data
+            param_grid: Candidate values for each parameter
+            engine_config: Backtest engine configuration
+            base_config: Strategy config shared by all combinations
+                (grid values override it)
+            n_jobs: Number of worker processes (default: one per CPU core)
+        """
+        self.strategy_class = strategy_class
+        self.df = df
+        # NumPy axes (np.arange, np.linspace) become lists of Python scalars
+        # so coarse-to-fine search can look values up with .index() and
+        # strategies get plain ints; tuples are kept as they are (random
+        # search reads them as (low, high) ranges)
+        self.param_grid = {
+            key: self._as_list(values) for key, values in param_grid.items()
+        }
+        self.engine_config = engine_config or {"initial_capital": 10000.0}
+        self.base_config = base_config or {}
+        self.n_jobs = n_jobs
+
+    def get_combinations(
+        self, param_grid: Optional[Dict[str, List[Any]]] = None
+    ) -> List[Dict[str, Any]]:
+        """Expand a grid into parameter combinations
+
+        Combinations with ema_fast >= ema_slow are dropped up front since
+        strategies reject them.
+
+        Args:
+            param_grid: Grid to expand (default: the optimizer's grid)
+
+        Returns:
+            List of parameter dictionaries
+        """
+        if param_grid is None:
+            param_grid = self.param_grid
+
+        keys = list(param_grid)
+        combinations = []
+
+        for values in itertools.product(*(param_grid[k] for k in keys)):
+            params = dict(zip(keys, values))
+            ema_fast = params.get("ema_fast", self.base_config.get("ema_fast"))
+            ema_slow = params.get("ema_slow", self.base_config.get("ema_slow"))
+            if ema_fast is not None and ema_slow is not None and ema_fast >= ema_slow:
+                continue
+            combinations.append(params)
+
+        return combinations
+
+    def optimize(
+        self, metric: str = "sharpe_ratio", coarse_to_fine: bool = False
+    ) -> Dict[str, Any]:
+        """Run grid search
+
+        With ``coarse_to_fine`` the full grid is not evaluated. A coarse
+        grid of every other value on each axis is searched first, then only
+        the neighbouring values (one index either side) of the coarse winner
+        on each axis.
+
+        Args:
+            metric: Result metric to maximize
+            coarse_to_fine: Use the two-phase coarse-to-fine search
+
+        Returns:
+            Dictionary with best parameters and results
+        """
+        if coarse_to_fine:
+            coarse_grid = {k: v[::2] for k, v in self.param_grid.items()}
+            all_results = self._evaluate(self.get_combinations(coarse_grid))
+            best_params = self._best_params(all_results, metric)
+
+            fine_grid = {}
+            for key, values in self.param_grid.items():
+                i = values.index(best_params[key])
+                fine_grid[key] = values[max(i - 1, 0) : i + 2]
+
+            evaluated = all_results[list(self.param_grid)].to_dict("records")
+            remaining = [
+                params
+                for params in self.get_combinations(fine_grid)
+                if params not in evaluated
+            ]
+            if remaining:
+                all_results = pd.concat(
+                    [all_results, self._evaluate(remaining)], ignore_index=True
+                )
+        else:
+            all_results = self._evaluate(self.get_combinations())
+
+        all_results = all_results.sort_values(metric, ascending=False)
+        best_params = self._best_params(all_results, metric)
+
+        # Run final backtest with best params
+        strategy = self.strategy_class(self._make_config(best_params))
+        final_results = BacktestEngine(self.engine_config).run(self.df, strategy)
+
+        return {
+            "best_params": best_params,
+            "best_objective": final_results[metric],
+            "backtest_results": final_results,
+            "n_combinations": len(all_results),
+            "all_results": all_results,
+        }
+
+    @staticmethod
+    def _as_list(values):
+        """Grid axis as a list (tuples are returned unchanged)"""
+        if isinstance(values, tuple):
+            return values
+        if isinstance(values, np.ndarray):
+            return values.tolist()
+        return list(values)
+
+    def _make_config(self, params: Dict[str, Any]) -> Dict[str, Any]:
+        """Full strategy config for one parameter combination"""
+        return {
+            "atr_period": 14,
+            "initial_capital": self.engine_config.get("initial_capital", 10000),
+            **self.base_config,
+            **params,
+        }
+
+    def _evaluate(self, combinations: List[Dict[str, Any]]) -> pd.DataFrame:
+        """Backtest parameter combinations in parallel
+
+        Returns:
+            DataFrame with one row per combination: parameters followed by
+            metrics
+        """
+        if not combinations:
+            raise ValueError("Parameter grid has no valid combinations")
+
+        configs = {i: self._make_config(p) for i, p in enumerate(combinations)}
+
+        engine = BacktestEngine(self.engine_config)
+        results = engine.run_many(
+            self.df,
+            self.strategy_class,
+            configs,
+            max_workers=self.n_jobs,
+            metrics_only=True,
+        )
+
+        return pd.DataFrame([{**combinations[i], **results[i]} for i in configs])
+
+    def _best_params(self, all_results: pd.DataFrame, metric: str) -> Dict[str, Any]:
+        """Parameters of the best row by ``metric``"""
+        best = all_results.loc[[all_results[metric].idxmax()], list(self.param_grid)]
+        # to_dict returns native Python scalars (ints stay ints)
+        return best.to_dict("records")[0]
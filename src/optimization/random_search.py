@@ -0,0 +1,120 @@
+"""Random search over strategy parameters"""
+
+import numpy as np
+import pandas as pd
+from typing import Dict, Any, List, Optional
+from .grid_search import GridSearchOptimizer
+
+
+class RandomSearchOptimizer(GridSearchOptimizer):
+    """Random search over a parameter space
+
+    Samples a fixed budget of parameter combinations instead of the full
+    grid. With more than a few parameters this finds comparable optima with
+    far fewer backtests. Combinations are evaluated in parallel worker
+    processes like the grid search.
+    """
+
+    # Default search space: the outer bounds of BayesianOptimizer's ranges.
+    # Its conditional bounds (ema_slow from ema_fast + 20, atr_multiplier_tp
+    # from 2x atr_multiplier_sl) are not applied; only ema_fast >= ema_slow
+    # combinations are dropped. atr_period stays at 14 as in both optimizers.
+    DEFAULT_PARAM_SPACE = {
+        "ema_fast": (20, 100),
+        "ema_slow": (40, 300),
+        "atr_multiplier_sl": (0.3, 1.0),
+        "atr_multiplier_tp": (0.6, 5.0),
+        "rsi_period": (5, 25),
+        "volume_multiplier": (0.8, 2.0),
+        "position_size_pct": (0.3, 0.8),
+    }
+
+    def __init__(
+        self,
+        strategy_class,
+        df: pd.DataFrame,
+        param_space: Optional[Dict[str, Any]] = None,
+        n_iterations: int = 500,
+        engine_config: Optional[Dict[str, Any]] = None,
+        base_config: Optional[Dict[str, Any]] = None,
+        n_jobs: Optional[int] = None,
+        seed: Optional[int] = None,
+    ):
+        """Initialize random search optimizer
+
+        Args:
+            strategy_class: Strategy class to optimize
+            df: OHLCV data
+            param_space: Search space per parameter. A list is sampled as
+                discrete choices, a (low, high) tuple uniformly (integers
+                if both bounds are ints, inclusive)
+            n_iterations: Number of parameter combinations to evaluate
+            engine_config: Backtest engine configuration
+            base_config: Strategy config shared by all combinations
+            n_jobs: Number of worker processes (default: one per CPU core)
+            seed: Random seed for reproducible sampling
+        """
+        super().__init__(
+            strategy_class,
+            df,
+            param_space or self.DEFAULT_PARAM_SPACE,
+            engine_config=engine_config,
+            base_config=base_config,
+            n_jobs=n_jobs,
+        )
+        self.n_iterations = n_iterations
+        self.seed = seed
+
+    def get_combinations(self, param_grid=None) -> List[Dict[str, Any]]:
+        """Sample distinct valid parameter combinations
+
+        Combinations with ema_fast >= ema_slow and repeats are discarded and
+        resampled, up to a bounded number of draws.
+
+        Returns:
+            List of at most ``n_iterations`` parameter dictionaries
+        """
+        rng = np.random.default_rng(self.seed)
+        combinations = []
+        seen = set()
+
+        for _ in range(self.n_iterations * 10):
+            if len(combinations) >= self.n_iterations:
+                break
+
+            params = {
+                key: self._sample(rng, space) for key, space in self.param_grid.items()
+            }
+            ema_fast = params.get("ema_fast", self.base_config.get("ema_fast"))
+            ema_slow = params.get("ema_slow", self.base_config.get("ema_slow"))
+            if ema_fast is not None and ema_slow is not None and ema_fast >= ema_slow:
+                continue
+
+            key = tuple(params.values())
+            if key in seen:
+                continue
+            seen.add(key)
+            combinations.append(params)
+
+        return combinations
+
+    def optimize(self, metric: str = "sharpe_ratio") -> Dict[str, Any]:
+        """Run random search
+
+        Args:
+            metric: Result metric to maximize
+
+        Returns:
+            Dictionary with best parameters and results
+        """
+        return super().optimize(metric)
+
+    @staticmethod
+    def _sample(rng: np.random.Generator, space):
+        """Draw one value from a list of choices or a (low, high) range"""
+        if isinstance(space, tuple):
+            low, high = space
+            if isinstance(low, int) and isinstance(high, int):
+                return int(rng.integers(low, high + 1))
+            return float(rng.uniform(low, high))
+        return space[int(rng.integers(len(space)))]
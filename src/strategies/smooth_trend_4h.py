@@ -10,9 +10,11 @@ Key improvements over standard trend following:
 """
 
 from ..core.base_strategy import BaseStrategy
+from ..core.kernels import simulate_scaled
 from ..indicators import EMA, ATR, RSI, ADX
 from typing import Optional, Dict, Any
 import pandas as pd
+import numpy as np
 
 
 class SmoothTrend4HStrategy(BaseStrategy):
@@ -27,9 +29,29 @@ class SmoothTrend4HStrategy(BaseStrategy):
     - Consistent monthly performance
     """
 
-    def __init__(self, config: dict):
+    INDICATOR_PARAMS = (
+        "ema_fast",
+        "ema_slow",
+        "atr_period",
+        "rsi_period",
+        "adx_period",
+        "volume_period",
+    )
+
+    def __init__(self, config: dict, indicators: Optional[Dict[str, pd.Series]] = None):
+        """Initialize strategy
+
+        Args:
+            config: Strategy configuration
+            indicators: Precomputed indicator columns ("atr", "rsi", "adx",
+                "volume_avg") for the configured periods. These are aligned
+                to the data by index instead of being recalculated, so
+                optimizers can compute them once for all trials.
+        """
         super().__init__(config)
 
+        self.indicators = indicators or {}
+
         self.ema = EMA()
         self.atr = ATR()
         self.rsi = RSI()
@@ -37,15 +59,10 @@ class SmoothTrend4HStrategy(BaseStrategy):
 
         self.validate_config(config)
 
-        # Position scaling state
-        self.entry_scale_1 = 0.0
-        self.entry_scale_2 = 0.0
-        self.entry_scale_3 = 0.0
-        self.current_scale = 1
-        self.trail_start_price = None
-
     def calculate_indicators(self, df: pd.DataFrame) -> pd.DataFrame:
-        df = df.copy()
+        # Shallow copy: indicator columns are added to the copy only and the
+        # OHLCV columns are never modified, so they need not be cloned
+        df = df.copy(deep=False)
 
         # EMAs
         ema_fast_period = self.config.get("ema_fast", 45)
@@ -56,52 +73,70 @@ class SmoothTrend4HStrategy(BaseStrategy):
 
         # ATR
         atr_period = self.config.get("atr_period", 14)
-        df["atr"] = self.atr.calculate(df, atr_period)
+        if "atr" in self.indicators:
+            df["atr"] = self.indicators["atr"]
+        else:
+            df["atr"] = self.atr.calculate(df, atr_period)
 
         # ATR as % of price (for volatility sizing)
         df["atr_pct"] = (df["atr"] / df["close"]) * 100
 
         # RSI
         rsi_period = self.config.get("rsi_period", 7)
-        df["rsi"] = self.rsi.calculate(df, rsi_period)
+        if "rsi" in self.indicators:
+            df["rsi"] = self.indicators["rsi"]
+        else:
+            df["rsi"] = self.rsi.calculate(df, rsi_period)
 
         # ADX
         adx_period = self.config.get("adx_period", 14)
-        df["adx"] = self.adx.calculate(df, adx_period)
+        if "adx" in self.indicators:
+            df["adx"] = self.indicators["adx"]
+        else:
+            df["adx"] = self.adx.calculate(df, adx_period)
 
         # Volume average
         volume_period = self.config.get("volume_period", 20)
-        df["volume_avg"] = df["volume"].rolling(window=volume_period).mean()
-
-        # EMA alignment (both EMAs same direction)
-        df["ema_aligned"] = (df["ema_fast"] > df["ema_slow"]) == (
-            df["close"] > df["ema_slow"]
-        )
+        if "volume_avg" in self.indicators:
+            df["volume_avg"] = self.indicators["volume_avg"]
+        else:
+            df["volume_avg"] = df["volume"].rolling(window=volume_period).mean()
 
         return df
 
     def generate_signals(self, df: pd.DataFrame) -> pd.DataFrame:
+        """Generate entry, scale-in and stop signals
+
+        Filters are combined on NumPy arrays and only the columns read by
+        the bar loop are added to the frame.
+        """
+        close = df["close"].to_numpy()
+        ema_fast = df["ema_fast"].to_numpy()
+        ema_slow = df["ema_slow"].to_numpy()
+        rsi = df["rsi"].to_numpy()
+        atr = df["atr"].to_numpy()
+
         # Trend direction
-        df["is_bullish_trend"] = df["close"] > df["ema_slow"]
-        df["is_bearish_trend"] = df["close"] < df["ema_slow"]
+        is_bullish_trend = close > ema_slow
+        is_bearish_trend = close < ema_slow
 
         # EMA alignment
-        df["ema_bullish_aligned"] = df["ema_fast"] > df["ema_slow"]
-        df["ema_bearish_aligned"] = df["ema_fast"] < df["ema_slow"]
+        ema_bullish_aligned = ema_fast > ema_slow
+        ema_bearish_aligned = ema_fast < ema_slow
 
         # Trend strength filter (ADX)
         adx_threshold = self.config.get("adx_threshold", 25)
-        df["strong_trend"] = df["adx"] >= adx_threshold
+        strong_trend = df["adx"].to_numpy() >= adx_threshold
 
         # Pullback to fast EMA (tighter threshold for 4H)
         pullback_threshold = self.config.get("pullback_threshold_pct", 0.008)
-        df["near_ema_fast"] = (
-            abs(df["close"] - df["ema_fast"]) / df["close"] < pullback_threshold
-        )
+        near_ema_fast = np.abs(close - ema_fast) < close * pullback_threshold
 
         # Enhanced volume confirmation (higher multiplier for quality)
         volume_multiplier = self.config.get("volume_multiplier", 1.3)
-        df["volume_confirmed"] = df["volume"] >= df["volume_avg"] * volume_multiplier
+        volume_confirmed = (
+            df["volume"].to_numpy() >= df["volume_avg"].to_numpy() * volume_multiplier
+        )
 
         # RSI range filter (avoid extremes, prefer mid-range pullbacks)
         rsi_long_min = self.config.get("rsi_long_min", 40)
@@ -109,258 +144,117 @@ class SmoothTrend4HStrategy(BaseStrategy):
         rsi_short_min = self.config.get("rsi_short_min", 40)
         rsi_short_max = self.config.get("rsi_short_max", 60)
 
-        df["rsi_long_ok"] = (df["rsi"] >= rsi_long_min) & (df["rsi"] <= rsi_long_max)
-        df["rsi_short_ok"] = (df["rsi"] >= rsi_short_min) & (df["rsi"] <= rsi_short_max)
+        rsi_long_ok = (rsi >= rsi_long_min) & (rsi <= rsi_long_max)
+        rsi_short_ok = (rsi >= rsi_short_min) & (rsi <= rsi_short_max)
 
         # Entry signals (all conditions must be met)
-        df["long_signal"] = (
-            df["is_bullish_trend"]
-            & df["ema_bullish_aligned"]
-            & df["strong_trend"]
-            & df["near_ema_fast"]
-            & df["volume_confirmed"]
-            & df["rsi_long_ok"]
-        )
-
-        df["short_signal"] = (
-            df["is_bearish_trend"]
-            & df["ema_bearish_aligned"]
-            & df["strong_trend"]
-            & df["near_ema_fast"]
-            & df["volume_confirmed"]
-            & df["rsi_short_ok"]
-        )
-
-        # Scale-in signals (second and third entries)
-        df["scale_long_2"] = df["long_signal"] & (df["close"] < df["ema_fast"])
-        df["scale_long_3"] = df["long_signal"] & (df["rsi"] < rsi_long_min + 5)
-
-        df["scale_short_2"] = df["short_signal"] & (df["close"] > df["ema_fast"])
-        df["scale_short_3"] = df["short_signal"] & (df["rsi"] > rsi_short_max - 5)
+        entry_ok = strong_trend & near_ema_fast & volume_confirmed
+        long_signal = is_bullish_trend & ema_bullish_aligned & rsi_long_ok & entry_ok
+        short_signal = is_bearish_trend & ema_bearish_aligned & rsi_short_ok & entry_ok
 
         # ATR-based stops
         atr_sl_mult = self.config.get("atr_multiplier_sl", 0.4)
         atr_tp_mult = self.config.get("atr_multiplier_tp", 1.2)
         trail_mult = self.config.get("trail_multiplier", 0.4)
 
-        df["atr_sl_distance"] = df["atr"] * atr_sl_mult
-        df["atr_tp_distance"] = df["atr"] * atr_tp_mult
-        df["trail_distance"] = df["atr"] * trail_mult
-
-        # Time stop (exit if trade hasn't hit TP after N bars)
-        df["time_stop_bars"] = self.config.get("time_stop_bars", 5)
-
-        return df
-
-    def execute_trade(self, df: pd.DataFrame, index: int):
-        row = df.iloc[index]
-        close = row["close"]
-
-        # Check exits first
-        if self.position is not None:
-            self._check_exit(df, index, close, row)
-
-        # Check entries
-        if self.position is None:
-            if row["long_signal"]:
-                self._enter_long_initial(index, close, row)
-            elif row["short_signal"]:
-                self._enter_short_initial(index, close, row)
-        else:
-            # Check for scale-in opportunities
-            self._check_scale_in(df, index, close, row)
-
-        # Update equity curve
-        self.equity_curve.append(self.capital)
-
-    def _get_position_size(self, price: float, atr_pct: float, row: pd.Series) -> float:
-        """Dynamic position sizing based on volatility
+        return self.add_columns(
+            df,
+            {
+                "is_bullish_trend": is_bullish_trend,
+                "is_bearish_trend": is_bearish_trend,
+                "long_signal": long_signal,
+                "short_signal": short_signal,
+                # Scale-in signals (second and third entries)
+                "scale_long_2": long_signal & (close < ema_fast),
+                "scale_long_3": long_signal & (rsi < rsi_long_min + 5),
+                "scale_short_2": short_signal & (close > ema_fast),
+                "scale_short_3": short_signal & (rsi > rsi_short_max - 5),
+                "atr_sl_distance": atr * atr_sl_mult,
+                "atr_tp_distance": atr * atr_tp_mult,
+                "trail_distance": atr * trail_mult,
+            },
+        )
 
-        High volatility -> smaller position
-        Low volatility -> larger position
+    # Columns read by the simulate_scaled bar loop
+    BAR_COLUMNS = (
+        "close",
+        "long_signal",
+        "short_signal",
+        "scale_long_2",
+        "scale_long_3",
+        "scale_short_2",
+        "scale_short_3",
+        "is_bullish_trend",
+        "is_bearish_trend",
+        "atr_pct",
+        "atr_sl_distance",
+        "atr_tp_distance",
+        "trail_distance",
+    )
+
+    def _bar_arrays(self, df: pd.DataFrame) -> Dict[str, np.ndarray]:
+        """Extract the columns used by the bar loop as NumPy arrays"""
+        return {col: df[col].to_numpy() for col in self.BAR_COLUMNS}
+
+    def execute_trades(self, df: pd.DataFrame):
+        """Execute trade logic over all bars with the compiled kernel
+
+        Columns are passed to ``simulate_scaled`` as NumPy arrays; the trade
+        arrays it returns are converted back into trade dictionaries
+        afterwards.
         """
-        base_pct = self.config.get("position_size_pct", 0.5)
+        arrays = self._bar_arrays(df)
+        (
+            equity,
+            entry_price,
+            exit_price,
+            trade_size,
+            pnl,
+            reason,
+            side,
+            entry_bar,
+            exit_bar,
+            scales,
+            scale_prices,
+            n_trades,
+        ) = simulate_scaled(
+            arrays["close"].astype(np.float64, copy=False),
+            arrays["long_signal"].astype(np.bool_, copy=False),
+            arrays["short_signal"].astype(np.bool_, copy=False),
+            arrays["scale_long_2"].astype(np.bool_, copy=False),
+            arrays["scale_long_3"].astype(np.bool_, copy=False),
+            arrays["scale_short_2"].astype(np.bool_, copy=False),
+            arrays["scale_short_3"].astype(np.bool_, copy=False),
+            arrays["is_bullish_trend"].astype(np.bool_, copy=False),
+            arrays["is_bearish_trend"].astype(np.bool_, copy=False),
+            arrays["atr_pct"].astype(np.float64, copy=False),
+            arrays["atr_sl_distance"].astype(np.float64, copy=False),
+            arrays["atr_tp_distance"].astype(np.float64, copy=False),
+            arrays["trail_distance"].astype(np.float64, copy=False),
+            float(self.capital),
+            float(self.config.get("position_size_pct", 0.5)),
+            self.get_warmup_bars(df),
+        )
 
-        if atr_pct > 1.0:
-            size_pct = base_pct * 0.8
-        elif atr_pct > 0.5:
-            size_pct = base_pct
-        else:
-            size_pct = base_pct * 1.2
-
-        return self.capital * size_pct / price
-
-    def _enter_long_initial(self, i: int, close: float, row: pd.Series):
-        atr_sl_distance = row["atr_sl_distance"]
-        atr_tp_distance = row["atr_tp_distance"]
-
-        atr_pct = row["atr_pct"]
-        base_position_size = self._get_position_size(close, atr_pct, row)
-
-        # Initial entry (50% of base position)
-        self.position = "long"
-        self.entry_price = close
-        self.entry_time = row.name
-        self.position_size = base_position_size * 0.5
-        self.entry_scale_1 = close
-        self.current_scale = 1
-
-        self.stop_loss = close - atr_sl_distance
-        self.take_profit = close + atr_tp_distance
-        self.trail_start_price = None
-
-    def _enter_short_initial(self, i: int, close: float, row: pd.Series):
-        atr_sl_distance = row["atr_sl_distance"]
-        atr_tp_distance = row["atr_tp_distance"]
-
-        atr_pct = row["atr_pct"]
-        base_position_size = self._get_position_size(close, atr_pct, row)
-
-        self.position = "short"
-        self.entry_price = close
-        self.entry_time = row.name
-        self.position_size = base_position_size * 0.5
-        self.entry_scale_1 = close
-        self.current_scale = 1
-
-        self.stop_loss = close + atr_sl_distance
-        self.take_profit = close - atr_tp_distance
-        self.trail_start_price = None
-
-    def _check_scale_in(self, df: pd.DataFrame, i: int, close: float, row: pd.Series):
-        """Check for scale-in opportunities (second and third entries)"""
-        if self.current_scale >= 3:
-            return
-
-        atr_pct = row["atr_pct"]
-        base_position_size = self._get_position_size(close, atr_pct, row)
-
-        if self.position == "long" and row["scale_long_2"] and self.current_scale == 1:
-            scale_size = base_position_size * 0.3
-            avg_price = (
-                (self.entry_price * self.position_size) + (close * scale_size)
-            ) / (self.position_size + scale_size)
-            self.position_size += scale_size
-            self.entry_price = avg_price
-            self.entry_scale_2 = close
-            self.current_scale = 2
-
-        elif (
-            self.position == "long" and row["scale_long_3"] and self.current_scale == 2
-        ):
-            scale_size = base_position_size * 0.2
-            avg_price = (
-                (self.entry_price * self.position_size) + (close * scale_size)
-            ) / (self.position_size + scale_size)
-            self.position_size += scale_size
-            self.entry_price = avg_price
-            self.entry_scale_3 = close
-            self.current_scale = 3
-
-        elif (
-            self.position == "short"
-            and row["scale_short_2"]
-            and self.current_scale == 1
-        ):
-            scale_size = base_position_size * 0.3
-            avg_price = (
-                (self.entry_price * self.position_size) + (close * scale_size)
-            ) / (self.position_size + scale_size)
-            self.position_size += scale_size
-            self.entry_price = avg_price
-            self.entry_scale_2 = close
-            self.current_scale = 2
-
-        elif (
-            self.position == "short"
-            and row["scale_short_3"]
-            and self.current_scale == 2
+        trades = self.trades_from_arrays(
+            df.index,
+            n_trades,
+            entry_price,
+            exit_price,
+            trade_size,
+            pnl,
+            reason,
+            side,
+            entry_bar,
+            exit_bar,
+        )
+        for trade, n_scales, prices in zip(
+            trades, scales[:n_trades].tolist(), scale_prices
         ):
-            scale_size = base_position_size * 0.2
-            avg_price = (
-                (self.entry_price * self.position_size) + (close * scale_size)
-            ) / (self.position_size + scale_size)
-            self.position_size += scale_size
-            self.entry_price = avg_price
-            self.entry_scale_3 = close
-            self.current_scale = 3
-
-    def _check_exit(self, df: pd.DataFrame, i: int, close: float, row: pd.Series):
-        exit_reason = None
-
-        if self.position == "long":
-            # Update trailing stop after half profit
-            if (
-                self.trail_start_price is None
-                and close
-                >= self.entry_price + (self.take_profit - self.entry_price) * 0.5
-            ):
-                self.trail_start_price = close
-
-            if self.trail_start_price is not None:
-                new_trail = close - row["trail_distance"]
-                if new_trail > self.stop_loss:
-                    self.stop_loss = new_trail
-
-            # Exit conditions - simplified
-            if close <= self.stop_loss:
-                exit_reason = "SL"
-            elif close >= self.take_profit:
-                exit_reason = "TP"
-            elif not df.iloc[i]["is_bullish_trend"]:
-                exit_reason = "Trend Change"
-
-        elif self.position == "short":
-            # Update trailing stop after half profit
-            if (
-                self.trail_start_price is None
-                and close
-                <= self.entry_price + (self.take_profit - self.entry_price) * 0.5
-            ):
-                self.trail_start_price = close
-
-            if self.trail_start_price is not None:
-                new_trail = close + row["trail_distance"]
-                if new_trail < self.stop_loss:
-                    self.stop_loss = new_trail
-
-            if close >= self.stop_loss:
-                exit_reason = "SL"
-            elif close <= self.take_profit:
-                exit_reason = "TP"
-            elif not df.iloc[i]["is_bearish_trend"]:
-                exit_reason = "Trend Change"
-
-        elif self.position == "short":
-            # Update trailing stop after half profit
-            if (
-                self.trail_start_price is None
-                and close
-                <= self.entry_price + (self.take_profit - self.entry_price) * 0.5
-            ):
-                self.trail_start_price = close
-
-            if self.trail_start_price is not None:
-                new_trail = close + row["trail_distance"]
-                if new_trail < self.stop_loss:
-                    self.stop_loss = new_trail
-
-            if close >= self.stop_loss:
-                exit_reason = "SL"
-            elif close <= self.take_profit:
-                exit_reason = "TP"
-            elif not df.iloc[i]["is_bearish_trend"]:
-                exit_reason = "Trend Change"
-            elif df.iloc[i]["adx"] < 20:
-                exit_reason = "Trend Weakness"
-            elif i - df.index.get_loc(self.entry_time) >= row["time_stop_bars"]:
-                exit_reason = "Time Stop"
-
-        if exit_reason:
-            trade = self.close_position(close, exit_reason, exit_time=df.iloc[i].name)
-            trade["scales"] = self.current_scale
-            trade["scale_prices"] = [
-                self.entry_scale_1,
-                self.entry_scale_2,
-                self.entry_scale_3,
-            ][: self.current_scale]
+            trade["scales"] = n_scales
+            trade["scale_prices"] = prices[:n_scales].tolist()
+        self.trades.extend(trades)
+
+        self.equity_curve = equity
+        if len(equity):
+            self.capital = float(equity[-1])
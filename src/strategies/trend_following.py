@@ -1,9 +1,11 @@
 """Trend-following strategy using EMA pullback entries"""
 
 from ..core.base_strategy import BaseStrategy
+from ..core.kernels import simulate, simulate_grid
 from ..indicators import EMA, ATR, RSI
-from typing import Optional
+from typing import Optional, Sequence
 import pandas as pd
+import numpy as np
 
 
 class TrendFollowingStrategy(BaseStrategy):
@@ -15,6 +17,14 @@ class TrendFollowingStrategy(BaseStrategy):
     - Exit with ATR-based SL/TP or trend reversal
     """
 
+    INDICATOR_PARAMS = (
+        "ema_fast",
+        "ema_slow",
+        "atr_period",
+        "rsi_period",
+        "volume_period",
+    )
+
     def __init__(self, config: dict):
         super().__init__(config)
 
@@ -28,7 +38,9 @@ class TrendFollowingStrategy(BaseStrategy):
 
     def calculate_indicators(self, df: pd.DataFrame) -> pd.DataFrame:
         """Calculate all indicators"""
-        df = df.copy()
+        # Shallow copy: indicator columns are added to the copy only and the
+        # OHLCV columns are never modified, so they need not be cloned
+        df = df.copy(deep=False)
 
         # EMAs
         ema_fast_period = self.config.get("ema_fast", 50)
@@ -52,118 +64,168 @@ class TrendFollowingStrategy(BaseStrategy):
         return df
 
     def generate_signals(self, df: pd.DataFrame) -> pd.DataFrame:
-        """Generate entry and exit signals"""
+        """Generate entry and exit signals
+
+        Filters are combined on NumPy arrays and only the signal and stop
+        distance columns are added to the frame.
+        """
+        close = df["close"].to_numpy()
+        ema_slow = df["ema_slow"].to_numpy()
+        rsi = df["rsi"].to_numpy()
+        atr = df["atr"].to_numpy()
+
         # Trend direction
-        df["is_bullish_trend"] = df["close"] > df["ema_slow"]
-        df["is_bearish_trend"] = df["close"] < df["ema_slow"]
+        is_bullish_trend = close > ema_slow
+        is_bearish_trend = close < ema_slow
 
         # Pullback to fast EMA
         pullback_threshold = self.config.get("pullback_threshold_pct", 0.01)
-        df["near_ema_fast"] = (
-            abs(df["close"] - df["ema_fast"]) / df["close"] < pullback_threshold
+        near_ema_fast = (
+            np.abs(close - df["ema_fast"].to_numpy()) < close * pullback_threshold
         )
 
         # Volume confirmation
         volume_multiplier = self.config.get("volume_multiplier", 1.2)
-        df["volume_confirmed"] = df["volume"] >= df["volume_avg"] * volume_multiplier
+        volume_confirmed = (
+            df["volume"].to_numpy() >= df["volume_avg"].to_numpy() * volume_multiplier
+        )
 
         # RSI filters
         rsi_overbought = self.config.get("rsi_overbought", 70)
         rsi_oversold = self.config.get("rsi_oversold", 30)
 
-        df["rsi_long_ok"] = df["rsi"] < rsi_overbought
-        df["rsi_short_ok"] = df["rsi"] > rsi_oversold
-
         # Entry signals
-        df["long_signal"] = (
-            df["is_bullish_trend"]
-            & df["near_ema_fast"]
-            & df["volume_confirmed"]
-            & df["rsi_long_ok"]
-        )
-
-        df["short_signal"] = (
-            df["is_bearish_trend"]
-            & df["near_ema_fast"]
-            & df["volume_confirmed"]
-            & df["rsi_short_ok"]
-        )
+        entry_ok = near_ema_fast & volume_confirmed
 
         # ATR-based stops
         atr_sl_mult = self.config.get("atr_multiplier_sl", 0.5)
         atr_tp_mult = self.config.get("atr_multiplier_tp", 2.0)
 
-        df["atr_sl_distance"] = df["atr"] * atr_sl_mult
-        df["atr_tp_distance"] = df["atr"] * atr_tp_mult
+        return self.add_columns(
+            df,
+            {
+                "is_bullish_trend": is_bullish_trend,
+                "is_bearish_trend": is_bearish_trend,
+                "long_signal": is_bullish_trend & entry_ok & (rsi < rsi_overbought),
+                "short_signal": is_bearish_trend & entry_ok & (rsi > rsi_oversold),
+                "atr_sl_distance": atr * atr_sl_mult,
+                "atr_tp_distance": atr * atr_tp_mult,
+            },
+        )
 
-        return df
+    def execute_trades(self, df: pd.DataFrame):
+        """Execute trade logic over all bars with the compiled kernel
+
+        Columns are passed to ``simulate`` as NumPy arrays; the trade arrays
+        it returns are converted into trade dictionaries in bulk afterwards.
+        """
+        (
+            equity,
+            entry_price,
+            exit_price,
+            trade_size,
+            pnl,
+            reason,
+            side,
+            entry_bar,
+            exit_bar,
+            n_trades,
+        ) = simulate(
+            df["close"].to_numpy(dtype=np.float64),
+            df["long_signal"].to_numpy(dtype=np.bool_),
+            df["short_signal"].to_numpy(dtype=np.bool_),
+            df["is_bullish_trend"].to_numpy(dtype=np.bool_),
+            df["is_bearish_trend"].to_numpy(dtype=np.bool_),
+            df["atr"].to_numpy(dtype=np.float64),
+            float(self.config.get("atr_multiplier_sl", 0.5)),
+            float(self.config.get("atr_multiplier_tp", 2.0)),
+            float(self.capital),
+            float(self.config.get("position_size_pct", 0.5)),
+            self.get_warmup_bars(df),
+        )
+
+        self.trades.extend(
+            self.trades_from_arrays(
+                df.index,
+                n_trades,
+                entry_price,
+                exit_price,
+                trade_size,
+                pnl,
+                reason,
+                side,
+                entry_bar,
+                exit_bar,
+            )
+        )
 
-    def execute_trade(self, df: pd.DataFrame, index: int):
-        """Execute trade logic for current bar"""
-        row = df.iloc[index]
-        close = row["close"]
-
-        # Check exits first
-        if self.position is not None:
-            self._check_exit(df, index, close)
-
-        # Check entries
-        if self.position is None:
-            if row["long_signal"]:
-                self._enter_long(index, close, row)
-            elif row["short_signal"]:
-                self._enter_short(index, close, row)
-
-        # Update equity curve
-        self.equity_curve.append(self.capital)
-
-    def _enter_long(self, i: int, close: float, row: pd.Series):
-        """Enter long position"""
-        atr_sl_distance = row["atr_sl_distance"]
-        atr_tp_distance = row["atr_tp_distance"]
-
-        position_size_pct = self.config.get("position_size_pct", 0.5)
-
-        self.position = "long"
-        self.entry_price = close
-        self.entry_time = row.name
-        self.position_size = self.capital * position_size_pct / close
-        self.stop_loss = close - atr_sl_distance
-        self.take_profit = close + atr_tp_distance
-
-    def _enter_short(self, i: int, close: float, row: pd.Series):
-        """Enter short position"""
-        atr_sl_distance = row["atr_sl_distance"]
-        atr_tp_distance = row["atr_tp_distance"]
-
-        position_size_pct = self.config.get("position_size_pct", 0.5)
-
-        self.position = "short"
-        self.entry_price = close
-        self.entry_time = row.name
-        self.position_size = self.capital * position_size_pct / close
-        self.stop_loss = close + atr_sl_distance
-        self.take_profit = close - atr_tp_distance
-
-    def _check_exit(self, df: pd.DataFrame, i: int, close: float):
-        """Check exit conditions"""
-        exit_reason = None
-
-        if self.position == "long":
-            if close <= self.stop_loss:
-                exit_reason = "SL"
-            elif close >= self.take_profit:
-                exit_reason = "TP"
-            elif not df.iloc[i]["is_bullish_trend"]:
-                exit_reason = "Trend Change"
-
-        elif self.position == "short":
-            if close >= self.stop_loss:
-                exit_reason = "SL"
-            elif close <= self.take_profit:
-                exit_reason = "TP"
-            elif not df.iloc[i]["is_bearish_trend"]:
-                exit_reason = "Trend Change"
-
-        if exit_reason:
-            self.close_position(close, exit_reason, exit_time=df.iloc[i].name)
+        self.equity_curve = equity
+        if len(equity):
+            self.capital = float(equity[-1])
+
+    def sweep_stops(
+        self,
+        df: pd.DataFrame,
+        sl_mults: Sequence[float],
+        tp_mults: Sequence[float],
+        size_pcts: Optional[Sequence[float]] = None,
+    ) -> pd.DataFrame:
+        """Backtest every (SL, TP, size) combination in parallel
+
+        Indicators and signals are computed once; only the stop/target
+        multipliers and position size vary, so all combinations run in a
+        single compiled kernel spread across CPU cores.
+
+        Args:
+            df: OHLCV data
+            sl_mults: Stop-loss ATR multipliers to test
+            tp_mults: Take-profit ATR multipliers to test
+            size_pcts: Position sizes to test (default: the configured
+                position_size_pct)
+
+        Returns:
+            DataFrame with one row per combination and columns
+            atr_multiplier_sl, atr_multiplier_tp, position_size_pct,
+            total_return, sharpe_ratio, max_drawdown, total_trades, win_rate
+        """
+        if size_pcts is None:
+            size_pcts = [self.config.get("position_size_pct", 0.5)]
+
+        df = self.generate_signals(self.calculate_indicators(df))
+
+        sl_grid, tp_grid, size_grid = np.meshgrid(
+            np.asarray(sl_mults, dtype=np.float64),
+            np.asarray(tp_mults, dtype=np.float64),
+            np.asarray(size_pcts, dtype=np.float64),
+            indexing="ij",
+        )
+        sl_flat = sl_grid.ravel()
+        tp_flat = tp_grid.ravel()
+        size_flat = size_grid.ravel()
+
+        stats = simulate_grid(
+            df["close"].to_numpy(dtype=np.float64),
+            df["long_signal"].to_numpy(dtype=np.bool_),
+            df["short_signal"].to_numpy(dtype=np.bool_),
+            df["is_bullish_trend"].to_numpy(dtype=np.bool_),
+            df["is_bearish_trend"].to_numpy(dtype=np.bool_),
+            df["atr"].to_numpy(dtype=np.float64),
+            sl_flat,
+            tp_flat,
+            size_flat,
+            float(self.initial_capital),
+            self.get_warmup_bars(df),
+        )
+
+        return pd.DataFrame(
+            {
+                "atr_multiplier_sl": sl_flat,
+                "atr_multiplier_tp": tp_flat,
+                "position_size_pct": size_flat,
+                "total_return": stats[:, 0],
+                "sharpe_ratio": stats[:, 1],
+                "max_drawdown": stats[:, 2],
+                "total_trades": stats[:, 3].astype(np.int64),
+                "win_rate": stats[:, 4],
+            }
+        )